@@ -0,0 +1,24 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+import time
+import board
+from wiichuck.classic_controller import ClassicController
+
+controller = ClassicController(board.I2C(), high_resolution=True)
+if not controller.high_resolution:
+    print("This controller only supports the standard resolution")
+
+while True:
+    joysticks, _, _, triggers = controller.values
+    print(
+        "left {},{} right {},{} triggers {},{}".format(
+            joysticks.lx,
+            joysticks.ly,
+            joysticks.rx,
+            joysticks.ry,
+            triggers.left,
+            triggers.right,
+        )
+    )
+    time.sleep(0.1)
@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+import time
+import board
+from wiichuck.classic_controller import ClassicController
+
+controller = ClassicController(board.I2C())
+
+# only the left joystick and the face buttons are decoded on each read
+read = controller.reader(
+    ("joysticks.lx", "joysticks.ly", "buttons.A", "buttons.B", "buttons.X", "buttons.Y")
+)
+
+while True:
+    x, y, A, B, X, Y = read()
+    print("left joystick: {}, {}".format(x, y), "A" * A, "B" * B, "X" * X, "Y" * Y)
+    time.sleep(0.1)
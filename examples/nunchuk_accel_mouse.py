@@ -15,16 +15,12 @@ centerY = 110
 scaleX = 0.4
 scaleY = 0.5
 
-cDown = False
-zDown = False
-
-# This is to allow double checking (only on left click - and it doesn't really work)
-CHECK_COUNT = 0
-
+# Z is the left mouse button and C the right one
+MOUSE_BUTTONS = {Nunchuk.BTN_Z: Mouse.LEFT_BUTTON, Nunchuk.BTN_C: Mouse.RIGHT_BUTTON}
 
 # This is just to show that we're getting back data - uncomment it and hold down the buttons
 # while True:
-#    print((0 if nc.button_C else 1, 0 if nc.button_Z else 1))
+#    print(nc.buttons)
 
 while True:
     accel = nc.acceleration
@@ -41,32 +37,10 @@ while True:
     relY = y - centerY
 
     m.move(int(scaleX * relX), int(scaleY * relY), 0)
-    buttons = nc.buttons
-
-    c = buttons.C
-    z = buttons.Z
 
-    if z and not zDown:
-        stillDown = True
-        for n in range(CHECK_COUNT):
-            if nc.button_Z:
-                stillDown = False
-                break
-        if stillDown:
-            m.press(Mouse.LEFT_BUTTON)
-            zDown = True
-    elif not z and zDown:
-        stillDown = True
-        for n in range(CHECK_COUNT):
-            if not nc.button_Z:
-                stillDown = False
-                break
-        if stillDown:
-            m.release(Mouse.LEFT_BUTTON)
-            zDown = False
-    if c and not cDown:
-        m.press(Mouse.RIGHT_BUTTON)
-        cDown = True
-    elif not c and cDown:
-        m.release(Mouse.RIGHT_BUTTON)
-        cDown = False
+    # only the buttons pressed or released since the last loop, from the same read
+    for _, button, pressed in nc.button_events(do_read=False):
+        if pressed:
+            m.press(MOUSE_BUTTONS[button])
+        else:
+            m.release(MOUSE_BUTTONS[button])
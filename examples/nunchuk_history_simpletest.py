@@ -0,0 +1,24 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+import time
+import board
+from wiichuck.nunchuk import Nunchuk
+
+# keep the last 32 frames, 384 bytes allocated once
+nc = Nunchuk(board.I2C(), history=32)
+
+while True:
+    nc.values  # pylint: disable=pointless-statement
+    history = nc.history
+    if len(history) == history.capacity:
+        # joystick velocity over the whole window, in steps per second
+        # pylint: disable=unsubscriptable-object
+        oldest, newest = history[0].joystick, history[-1].joystick
+        seconds = history.elapsed(0) / 1e6
+        print(
+            "joystick velocity = {:.0f},{:.0f}".format(
+                (newest.x - oldest.x) / seconds, (newest.y - oldest.y) / seconds
+            )
+        )
+    time.sleep(0.01)
@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+import time
+import asyncio
+import board
+from wiichuck.aio import AsyncWiiChuck
+from wiichuck.nunchuk import Nunchuk
+
+DURATION = 5
+RATE_HZ = 200
+
+nc = AsyncWiiChuck(Nunchuk(board.I2C()))
+counts = {"polls": 0, "other": 0}
+
+
+async def poll(end):
+    async for _ in nc.stream(rate_hz=RATE_HZ):
+        counts["polls"] += 1
+        if time.monotonic() > end:
+            break
+
+
+async def other_task(end):
+    # stands in for the network and display tasks
+    while time.monotonic() < end:
+        counts["other"] += 1
+        await asyncio.sleep(0)
+
+
+async def main():
+    end = time.monotonic() + DURATION
+    await asyncio.gather(poll(end), other_task(end))
+    print(
+        "{:.0f} polls/sec while the other task ran {:.0f} times/sec".format(
+            counts["polls"] / DURATION, counts["other"] / DURATION
+        )
+    )
+
+
+asyncio.run(main())
@@ -0,0 +1,14 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+import time
+import board
+import wiichuck
+
+# works with a Nunchuk, Classic Controller, Guitar, Drums, DJ Table or uDraw
+controller = wiichuck.create(board.I2C())
+print("Found a {}".format(type(controller).__name__))
+
+while True:
+    print(controller.values)
+    time.sleep(0.5)
@@ -0,0 +1,21 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+# Runs on Linux/Blinka hosts with NumPy installed and measures how many
+# frames/sec the batch decoders handle. tests/test_batch.py checks them
+# against the device classes.
+
+import time
+import numpy as np
+from wiichuck import batch
+
+BENCHMARK_FRAMES = 1000000
+
+rng = np.random.default_rng(0)
+
+for device_name in batch.DECODERS:
+    frames = rng.integers(0, 256, (BENCHMARK_FRAMES, 8), dtype=np.uint8)
+    start = time.perf_counter()
+    batch.decode(frames, device_name)
+    elapsed = time.perf_counter() - start
+    print("{}: {:.0f} frames/sec".format(device_name, BENCHMARK_FRAMES / elapsed))
@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+# Runs without hardware against simulated accessories and saves the results
+# as JSON, so that releases can be compared:
+#   python wiichuck_benchmark_suite.py [results.json]
+
+import gc
+import json
+import sys
+import time
+from wiichuck.classic_controller import ClassicController
+from wiichuck.dj_table import DJTable
+from wiichuck.drums import Drums
+from wiichuck.guitar import Guitar
+from wiichuck.nunchuk import Nunchuk
+from wiichuck.udraw import UDraw
+from wiichuck.simulator import (
+    SimulatedAccessory,
+    SimulatedI2C,
+    random_frames,
+    scripted_frames,
+)
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+POLLS = 2000
+READ_DELAYS = (0.0, 0.0005, 0.001, 0.002)
+PROPERTIES = {
+    Nunchuk: ("joystick", "buttons", "acceleration"),
+    ClassicController: ("joysticks", "buttons", "dpad", "triggers"),
+    Guitar: ("joystick", "buttons", "strum", "whammy", "touchbar"),
+    Drums: ("joystick", "buttons"),
+    DJTable: ("joystick", "buttons", "turntables", "dial", "slider"),
+    UDraw: ("position", "buttons", "pressure"),
+}
+
+
+def controller(accessory, i2c_read_delay=0.0):
+    # pregenerated so that the simulator allocates nothing while polling
+    frames = random_frames(accessory, seed=0)
+    frames = scripted_frames([next(frames) for _ in range(64)])
+    simulated = SimulatedAccessory.for_device(accessory, frames, latency=0)
+    return accessory(
+        SimulatedI2C(simulated), i2c_read_delay=i2c_read_delay, fast_init=True
+    )
+
+
+def microseconds_per_call(function, count=POLLS):
+    function()  # warm up
+    start = time.monotonic_ns()
+    for _ in range(count):
+        function()
+    return (time.monotonic_ns() - start) / count / 1000
+
+
+def bytes_per_call(function, count=POLLS):
+    function()  # warm up
+    gc.collect()
+    if tracemalloc:
+        # CPython frees short-lived objects right away, so add up the peak of
+        # each call rather than the memory still in use at the end
+        allocated = 0
+        tracemalloc.start()
+        for _ in range(count):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            function()
+            allocated += tracemalloc.get_traced_memory()[1] - before
+        tracemalloc.stop()
+        return allocated / count
+    gc.disable()
+    before = gc.mem_free()  # pylint: disable=no-member
+    for _ in range(count):
+        function()
+    allocated = before - gc.mem_free()  # pylint: disable=no-member
+    gc.enable()
+    return allocated / count
+
+
+def benchmark(accessory):
+    device = controller(accessory)
+    frame = bytes(device._read_data())  # pylint: disable=protected-access
+    results = {
+        "decode_us": microseconds_per_call(lambda: device.decode_frame(frame)),
+        "values_us": microseconds_per_call(lambda: device.values),
+        "update_us": microseconds_per_call(device.update),
+        "reader_us": microseconds_per_call(device.reader(PROPERTIES[accessory][:2])),
+        "values_bytes": bytes_per_call(lambda: device.values),
+        "update_bytes": bytes_per_call(device.update),
+        "properties_us": {},
+        "polls_per_second": {},
+    }
+    for name in PROPERTIES[accessory]:
+        results["properties_us"][name] = microseconds_per_call(
+            lambda name=name: getattr(device, name)
+        )
+    for delay in READ_DELAYS:
+        device = controller(accessory, delay)
+        polls = POLLS // 10
+        results["polls_per_second"][str(delay)] = 1e6 / microseconds_per_call(
+            lambda device=device: device.values, polls
+        )
+    return results
+
+
+report = {
+    "implementation": sys.implementation.name,
+    "platform": sys.platform,
+    "polls": POLLS,
+    "devices": {},
+}
+for device_class in PROPERTIES:
+    report["devices"][device_class.__name__] = benchmark(device_class)
+    print(device_class.__name__, report["devices"][device_class.__name__])
+
+path = sys.argv[1] if len(sys.argv) > 1 else "wiichuck_benchmark.json"
+try:
+    with open(path, "w") as results_file:
+        json.dump(report, results_file)
+    print("Saved results to", path)
+except OSError:  # read-only filesystem on CircuitPython boards
+    print(json.dumps(report))
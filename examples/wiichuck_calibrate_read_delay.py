@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+# The filesystem must be writable by CircuitPython (see boot.py / storage.remount)
+# for the calibration results to be saved between boots.
+
+import json
+import board
+from wiichuck.nunchuk import Nunchuk
+
+CACHE_FILE = "/wiichuck_delays.json"
+
+try:
+    with open(CACHE_FILE, "r") as cache_file:
+        delays = json.load(cache_file)
+except (OSError, ValueError):
+    delays = {}
+
+nc = Nunchuk(board.I2C())
+print("default i2c_read_delay = {}s".format(nc.i2c_read_delay))
+
+# keep the nunchuk plugged in while calibrating
+delay = nc.calibrate_read_delay(cache=delays)
+print("calibrated i2c_read_delay = {}s".format(delay))
+
+try:
+    with open(CACHE_FILE, "w") as cache_file:
+        json.dump(delays, cache_file)
+except OSError:
+    print("Read-only filesystem, calibration not saved")
+
+while True:
+    print(nc.values)
@@ -0,0 +1,19 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+import board
+from wiichuck.nunchuk import Nunchuk
+
+# Replace Nunchuk with the class of the accessory being measured
+# (ClassicController, Guitar, Drums, DJTable or UDraw)
+ACCESSORY = Nunchuk
+
+i2c = board.I2C()
+
+for fast_init in (False, True):
+    controller = ACCESSORY(i2c, fast_init=fast_init)
+    print(
+        "{} fast_init={}: initialized in {:.1f}ms".format(
+            ACCESSORY.__name__, fast_init, controller.init_time * 1000
+        )
+    )
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+# Runs on the board without any accessory: measures what the compiled frame
+# layouts cost at import time and on the heap, against the closures that are
+# used where exec is not available.
+
+import gc
+import time
+
+gc.collect()
+heap = gc.mem_free()  # pylint: disable=no-member
+start = time.monotonic_ns()
+# pylint: disable=wrong-import-position
+from wiichuck import layout
+from wiichuck.classic_controller import ClassicController
+from wiichuck.dj_table import DJTable
+from wiichuck.drums import Drums
+from wiichuck.guitar import Guitar
+from wiichuck.nunchuk import Nunchuk
+from wiichuck.udraw import UDraw
+
+# pylint: enable=wrong-import-position
+# pylint: disable=protected-access
+print(
+    "import: {:.1f} ms, {} bytes".format(
+        (time.monotonic_ns() - start) / 1e6,
+        heap - gc.mem_free(),  # pylint: disable=no-member
+    )
+)
+
+DECODES = 1000
+frame = bytearray(8)
+
+for compiled in (True, False):
+    layout._EXEC = compiled
+    for accessory in (Nunchuk, ClassicController, Guitar, Drums, DJTable, UDraw):
+        gc.collect()
+        heap = gc.mem_free()  # pylint: disable=no-member
+        start = time.monotonic_ns()
+        frame_layout = layout.Layout(
+            accessory._LAYOUT._values, accessory._LAYOUT.buttons_byte
+        )
+        build_ms = (time.monotonic_ns() - start) / 1e6
+        gc.collect()
+        size = heap - gc.mem_free()  # pylint: disable=no-member
+        start = time.monotonic_ns()
+        for _ in range(DECODES):
+            frame_layout.decode(frame)
+        print(
+            "{} {}: build {:.1f} ms, {} bytes, decode {:.0f} us".format(
+                "exec" if compiled else "closures",
+                accessory.__name__,
+                build_ms,
+                size,
+                (time.monotonic_ns() - start) / 1e3 / DECODES,
+            )
+        )
+        del frame_layout
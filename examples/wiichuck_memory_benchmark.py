@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+# Any accessory can be plugged in: every class decodes whatever frame it reads,
+# which is all that is needed to measure allocations.
+
+import gc
+import board
+from wiichuck.classic_controller import ClassicController
+from wiichuck.dj_table import DJTable
+from wiichuck.drums import Drums
+from wiichuck.guitar import Guitar
+from wiichuck.nunchuk import Nunchuk
+from wiichuck.udraw import UDraw
+
+POLLS = 100
+
+i2c = board.I2C()
+
+
+def bytes_per_poll(poll):
+    poll()  # warm up
+    gc.collect()
+    gc.disable()
+    before = gc.mem_free()  # pylint: disable=no-member
+    for _ in range(POLLS):
+        poll()
+    allocated = before - gc.mem_free()  # pylint: disable=no-member
+    gc.enable()
+    return allocated / POLLS
+
+
+for accessory in (Nunchuk, ClassicController, Guitar, Drums, DJTable, UDraw):
+    controller = accessory(i2c, fast_init=True)
+    print(
+        "{}: values {:.0f} bytes/poll, update() {:.0f} bytes/poll".format(
+            accessory.__name__,
+            bytes_per_poll(lambda device=controller: device.values),
+            bytes_per_poll(controller.update),
+        )
+    )
@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+# Runs on Linux/Blinka hosts with several I2C buses, for example a Raspberry Pi
+# with extra buses enabled through the i2c-gpio overlay.
+
+import time
+from adafruit_extended_bus import ExtendedI2C as I2C
+from wiichuck.nunchuk import Nunchuk
+from wiichuck.poller import MultiBusPoller
+
+BUS_IDS = (1, 3, 4)
+POLLS = 500
+
+buses = [(Nunchuk(I2C(bus_id), fast_init=True),) for bus_id in BUS_IDS]
+
+for count in range(1, len(buses) + 1):
+    with MultiBusPoller(buses[:count]) as poller:
+        start = time.monotonic_ns()
+        for _ in range(POLLS):
+            poller.poll()
+        elapsed = (time.monotonic_ns() - start) / 1e9
+    print("{} buses: {:.0f} reads/sec".format(count, POLLS * count / elapsed))
@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+import time
+import board
+import adafruit_tca9548a
+from wiichuck.classic_controller import ClassicController
+from wiichuck.multi_chuck import MultiChuck
+from wiichuck.nunchuk import Nunchuk
+
+mux = adafruit_tca9548a.TCA9548A(board.I2C())
+
+# one accessory per multiplexer channel
+players = MultiChuck(mux, ((0, Nunchuk), (1, Nunchuk), (2, ClassicController)))
+
+last_print = time.monotonic()
+while True:
+    players.poll()
+    if time.monotonic() - last_print > 1:
+        last_print = time.monotonic()
+        for channel, values in zip(players.channels, players.states):
+            print("channel {}: {}".format(channel, values))
+        print("{:.0f} reads/sec".format(players.rate))
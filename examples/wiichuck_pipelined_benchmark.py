@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+import time
+import board
+from wiichuck.nunchuk import Nunchuk
+
+POLLS = 500
+
+# time spent by the application between polls (driving LEDs, HID reports, ...)
+# in pipelined mode the read delay elapses while this work is being done
+WORK = 0.002
+
+i2c = board.I2C()
+
+
+def polls_per_second(controller, work_time):
+    start = time.monotonic_ns()
+    for _ in range(POLLS):
+        controller.values  # pylint: disable=pointless-statement
+        if work_time:
+            time.sleep(work_time)
+    return POLLS * 1e9 / (time.monotonic_ns() - start)
+
+
+for pipelined in (False, True):
+    nc = Nunchuk(i2c, pipelined=pipelined)
+    for work in (0, WORK):
+        print(
+            "pipelined={} work={}s: {:.0f} polls/sec".format(
+                pipelined, work, polls_per_second(nc, work)
+            )
+        )
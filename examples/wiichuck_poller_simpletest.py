@@ -0,0 +1,20 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+# Runs on Linux/Blinka hosts only, CircuitPython has no threads.
+
+import time
+import board
+from wiichuck.nunchuk import Nunchuk
+from wiichuck.poller import Poller
+
+with Poller(Nunchuk(board.I2C()), rate_hz=500) as poller:
+    while True:
+        sequence, values, age = poller.latest()
+        if values is not None:
+            print(
+                "#{} joystick = {},{} ({:.1f}ms old)".format(
+                    sequence, values.joystick.x, values.joystick.y, age * 1000
+                )
+            )
+        time.sleep(0.1)
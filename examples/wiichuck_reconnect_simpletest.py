@@ -0,0 +1,17 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+import time
+import board
+from wiichuck.nunchuk import Nunchuk
+
+nc = Nunchuk(board.I2C(), reconnect=True)
+nc.on_disconnect = lambda device: print("Nunchuk unplugged")
+nc.on_connect = lambda device: print("Nunchuk plugged back in")
+
+while True:
+    # never blocks on a missing nunchuk, it is reconnected in the background
+    joystick, buttons, acceleration = nc.values
+    if nc.connected:
+        print("joystick = {},{}".format(joystick.x, joystick.y))
+    time.sleep(0.1)
@@ -0,0 +1,27 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+# The filesystem must be writable by CircuitPython (see boot.py / storage.remount)
+# to save the recording.
+
+import time
+import board
+from wiichuck.nunchuk import Nunchuk
+from wiichuck.recorder import CompressedRecorder, Recorder
+
+DURATION = 10
+
+# compressed logs only store the bytes that changed, use them for long captures
+COMPRESSED = False
+
+nc = Nunchuk(board.I2C())
+
+path = "/nunchuk.wchz" if COMPRESSED else "/nunchuk.wchk"
+recorder_class = CompressedRecorder if COMPRESSED else Recorder
+
+with open(path, "wb") as log, recorder_class(nc, log):
+    end = time.monotonic() + DURATION
+    while time.monotonic() < end:
+        nc.values  # pylint: disable=pointless-statement
+
+print("Recorded {} seconds to {}".format(DURATION, path))
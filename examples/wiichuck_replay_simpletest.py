@@ -0,0 +1,13 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+# Runs on Linux/Blinka hosts, replaying a log saved by wiichuck_recorder_simpletest.py
+
+from wiichuck.replay import ReplayBus, REALTIME
+
+with ReplayBus("nunchuk.wchk", mode=REALTIME) as bus:
+    nc = bus.device()
+    print("Replaying {} frames".format(bus.frame_count))
+    for _ in range(bus.frame_count):
+        joystick, buttons, acceleration = nc.values
+        print(joystick, buttons)
@@ -0,0 +1,16 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+# runs without hardware: a simulated Nunchuk with random input
+import time
+from wiichuck.nunchuk import Nunchuk
+from wiichuck.simulator import SimulatedAccessory, SimulatedI2C, random_frames
+
+accessory = SimulatedAccessory.for_device(
+    Nunchuk, random_frames(Nunchuk, change_rate=0.2)
+)
+nc = Nunchuk(SimulatedI2C(accessory))
+
+while True:
+    print(nc.values)
+    time.sleep(0.5)
@@ -0,0 +1,21 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+import board
+from wiichuck.nunchuk import Nunchuk
+
+nc = Nunchuk(board.I2C())
+
+other_work = 0
+nc.begin_read()
+while True:
+    if nc.poll_ready():
+        nc.finish_read()
+        joystick, buttons, acceleration = nc.decode()
+        print("joystick = {},{}".format(joystick.x, joystick.y))
+        print("other work done while waiting: {}".format(other_work))
+        other_work = 0
+        nc.begin_read()
+
+    # the rest of the main loop (LEDs, HID reports, ...) runs here
+    other_work += 1
@@ -0,0 +1,27 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+# SPDX-License-Identifier: MIT
+
+import time
+import board
+from wiichuck.nunchuk import Nunchuk
+
+nc = Nunchuk(board.I2C(), stats=True)
+
+while True:
+    end = time.monotonic() + 5
+    while time.monotonic() < end:
+        try:
+            nc.values  # pylint: disable=pointless-statement
+        except OSError:
+            pass
+
+    stats = nc.stats
+    print(
+        "{:.0f} frames/sec, {} errors, {} invalid frames, {} reinits".format(
+            stats.rate, stats.errors, stats.invalid_frames, stats.reinits
+        )
+    )
+    for bucket, count in enumerate(stats.histogram):
+        if count:
+            print("  {:>6}us+: {}".format(2**bucket, count))
+    nc.reset_stats()
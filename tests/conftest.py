@@ -0,0 +1,22 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from wiichuck.simulator import SimulatedAccessory, SimulatedI2C
+
+
+@pytest.fixture
+def simulated():
+    """Build a device on a simulated bus, returning it with its accessory."""
+
+    def build(device_class, frames=None, accessory_kwargs=None, **kwargs):
+        accessory = SimulatedAccessory.for_device(
+            device_class, frames, latency=0, **(accessory_kwargs or {})
+        )
+        kwargs.setdefault("i2c_read_delay", 0)
+        kwargs.setdefault("fast_init", True)
+        return device_class(SimulatedI2C(accessory), **kwargs), accessory
+
+    return build
@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from wiichuck.classic_controller import ClassicController
+from wiichuck.dj_table import DJTable
+from wiichuck.drums import Drums
+from wiichuck.guitar import Guitar
+from wiichuck.nunchuk import Nunchuk
+from wiichuck.recorder import FLAG_HIGH_RESOLUTION, CompressedRecorder, Recorder
+from wiichuck.simulator import (
+    SimulatedAccessory,
+    SimulatedI2C,
+    random_frames as simulated_frames,
+    scripted_frames,
+)
+from wiichuck.udraw import UDraw
+
+np = pytest.importorskip("numpy")
+batch = pytest.importorskip("wiichuck.batch")
+
+DEVICE_CLASSES = (Nunchuk, ClassicController, Guitar, Drums, DJTable, UDraw)
+
+
+def random_frames(count=500):
+    frames = np.random.default_rng(0).integers(0, 256, (count, 8), dtype=np.uint8)
+    # third party Classic Controller frames, with the buttons in bytes 6 and 7
+    frames[:20, 4:6] = 0
+    return frames
+
+
+@pytest.mark.parametrize("device_class", DEVICE_CLASSES)
+def test_matches_scalar_decoder(device_class):
+    frames = random_frames()
+    columns = batch.decode(frames, device_class)
+    accessory = SimulatedAccessory.for_device(
+        device_class, scripted_frames(frames.tolist(), loop=False), latency=0
+    )
+    device = device_class(SimulatedI2C(accessory), i2c_read_delay=0, fast_init=True)
+    for index in range(len(frames)):
+        state = device.update()
+        for field in state.__slots__:
+            assert getattr(state, field) == columns[field][index], (field, index)
+
+
+def test_decode_by_name():
+    frames = random_frames(10)
+    expected = batch.decode_nunchuk(frames)
+    columns = batch.decode(frames, "Nunchuk")
+    for field, column in expected.items():
+        assert np.array_equal(columns[field], column)
+
+
+def test_rejects_short_frames():
+    with pytest.raises(ValueError):
+        batch.decode(np.zeros((4, 3), dtype=np.uint8), Nunchuk)
+
+
+def test_to_structured():
+    columns = batch.decode(random_frames(10), Nunchuk)
+    array = batch.to_structured(columns)
+    assert array.dtype.names == tuple(columns)
+    assert np.array_equal(array["joystick_x"], columns["joystick_x"])
+
+
+def record(simulated, path, recorder_class, count=50):
+    device, _ = simulated(Nunchuk, simulated_frames(Nunchuk, seed=0))
+    frames = []
+    with open(path, "wb") as log, recorder_class(device, log):
+        for _ in range(count):
+            device.update()
+            frames.append(bytes(device.buffer))
+    return frames
+
+
+def test_load_log(simulated, tmp_path):
+    path = tmp_path / "session.wchk"
+    frames = record(simulated, path, Recorder)
+    records, flags = batch.load_log(path)
+    assert flags == 0
+    assert [bytes(frame) for frame in records["frame"]] == frames
+    del records
+
+
+def test_rejects_compressed_log(simulated, tmp_path):
+    path = tmp_path / "session.wchz"
+    record(simulated, path, CompressedRecorder)
+    with pytest.raises(ValueError, match="Compressed"):
+        batch.load_log(path)
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(bytes(64))
+    with pytest.raises(ValueError):
+        batch.load_log(path)
+
+
+def test_high_resolution_log(simulated, tmp_path):
+    path = tmp_path / "classic.wchk"
+    device, _ = simulated(
+        ClassicController,
+        simulated_frames(ClassicController, seed=0),
+        high_resolution=True,
+    )
+    states = []
+    with open(path, "wb") as log, Recorder(device, log):
+        for _ in range(100):
+            state = device.update()
+            states.append({field: getattr(state, field) for field in state.__slots__})
+    records, flags = batch.load_log(path)
+    assert flags & FLAG_HIGH_RESOLUTION
+    columns = batch.decode(records["frame"], ClassicController, flags)
+    for index, state in enumerate(states):
+        for field, value in state.items():
+            assert columns[field][index] == value, (field, index)
+    with pytest.raises(ValueError):
+        batch.decode(records["frame"], Nunchuk, flags)
+    del records
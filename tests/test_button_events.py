@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+import time
+
+from wiichuck.classic_controller import ClassicController
+from wiichuck.nunchuk import Nunchuk
+from wiichuck.simulator import encode, scripted_frames
+
+
+def events(device, **kwargs):
+    return [(button, pressed) for _, button, pressed in device.button_events(**kwargs)]
+
+
+def test_press_and_release(simulated):
+    frames = [
+        encode(Nunchuk),
+        encode(Nunchuk, C=True),
+        encode(Nunchuk, C=True, Z=True),
+        encode(Nunchuk, C=True, Z=True),
+        encode(Nunchuk),
+    ]
+    device, _ = simulated(Nunchuk, scripted_frames(frames, loop=False))
+    assert not events(device)
+    assert events(device) == [(Nunchuk.BTN_C, True)]
+    assert events(device) == [(Nunchuk.BTN_Z, True)]
+    assert not events(device)
+    assert events(device) == [(Nunchuk.BTN_Z, False), (Nunchuk.BTN_C, False)]
+
+
+def test_events_of_frame_read(simulated):
+    frames = [encode(ClassicController, A=True, dpad_up=True)]
+    device, _ = simulated(ClassicController, scripted_frames(frames))
+    device.values  # pylint: disable=pointless-statement
+    assert sorted(events(device, do_read=False)) == sorted(
+        [(ClassicController.BTN_A, True), (ClassicController.BTN_UP, True)]
+    )
+    assert device.buttons_mask == ClassicController.BTN_A | ClassicController.BTN_UP
+
+
+def test_timestamps_increase(simulated):
+    frames = [encode(Nunchuk, C=True), encode(Nunchuk)]
+    device, _ = simulated(Nunchuk, scripted_frames(frames, loop=False))
+    (pressed,) = device.button_events()
+    (released,) = device.button_events()
+    assert pressed[0] <= released[0]
+
+
+def test_timestamp_of_the_read(simulated):
+    frames = [encode(Nunchuk, C=True)]
+    device, _ = simulated(Nunchuk, scripted_frames(frames))
+    before = time.monotonic_ns()
+    device.values  # pylint: disable=pointless-statement
+    after = time.monotonic_ns()
+    time.sleep(0.01)
+    ((timestamp, _, _),) = device.button_events(do_read=False)
+    assert before <= timestamp <= after
+
+
+def test_read_when_called(simulated):
+    frames = [encode(Nunchuk), encode(Nunchuk, C=True), encode(Nunchuk)]
+    device, accessory = simulated(Nunchuk, scripted_frames(frames, loop=False))
+    iterator = device.button_events()
+    assert accessory.reads == 2  # the identity and this frame
+    assert not list(iterator)
+    before = time.monotonic_ns()
+    iterator = device.button_events()
+    time.sleep(0.01)
+    ((timestamp, button, pressed),) = iterator
+    assert (button, pressed) == (Nunchuk.BTN_C, True)
+    assert before <= timestamp < before + 10_000_000
@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+import time
+
+import pytest
+
+from wiichuck.nunchuk import Nunchuk
+
+LATENCY = 0.005
+DELAY = 0.02
+
+
+def early_reads(accessory, answer):
+    """Make reads that come sooner than ``LATENCY`` after the pointer write
+    call ``answer(buffer, start, end)`` instead."""
+    original = accessory.read
+
+    def read(buffer, start, end):
+        # pylint: disable=protected-access
+        if time.monotonic_ns() - accessory._pointer_time < LATENCY * 1e9:
+            return answer(buffer, start, end)
+        return original(buffer, start, end)
+
+    accessory.read = read
+
+
+def nak(buffer, start, end):
+    raise OSError(121, "Simulated accessory did not respond")
+
+
+def half_updated(buffer, start, end):
+    for index in range(start, end):
+        buffer[index] = 0
+
+
+def calibrate(simulated, answer):
+    device, accessory = simulated(Nunchuk, i2c_read_delay=DELAY)
+    early_reads(accessory, answer)
+    delay = device.calibrate_read_delay(samples=4, resolution=0.0005, margin=0)
+    assert delay == device.i2c_read_delay
+    return delay
+
+
+@pytest.mark.parametrize("answer", (nak, half_updated))
+def test_rejects_early_reads(simulated, answer):
+    delay = calibrate(simulated, answer)
+    # sleeping may overshoot, which can only make the calibrated delay shorter
+    assert LATENCY - 0.002 < delay <= DELAY
+
+
+def test_delay_kept_on_failure(simulated):
+    device, accessory = simulated(Nunchuk, i2c_read_delay=DELAY)
+    accessory.connected = False
+    with pytest.raises(OSError):
+        device.calibrate_read_delay()
+    assert device.i2c_read_delay == DELAY
+
+
+def test_delay_restored_on_failure(simulated):
+    device, accessory = simulated(Nunchuk, i2c_read_delay=DELAY)
+    reads = []
+
+    def read(buffer, start, end):
+        reads.append(start)
+        if len(reads) > 16:
+            raise RuntimeError("Bus failure")
+        original(buffer, start, end)
+
+    original = accessory.read
+    accessory.read = read
+    with pytest.raises(RuntimeError):
+        device.calibrate_read_delay()
+    assert device.i2c_read_delay == DELAY
+
+
+def test_cache(simulated):
+    device, _ = simulated(Nunchuk)
+    cache = {device.device_id.hex(): 0.001}
+    assert device.calibrate_read_delay(cache=cache) == 0.001
+    assert device.i2c_read_delay == 0.001
@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+import time
+
+import pytest
+
+from wiichuck.classic_controller import ClassicController
+from wiichuck.recorder import FLAG_HIGH_RESOLUTION, Recorder
+from wiichuck.replay import ReplayBus
+from wiichuck.simulator import random_frames
+
+FRAMES = 200
+
+
+def failing(accessory, method, condition, count):
+    """Make ``count`` calls of the accessory ``method`` matching ``condition``
+    raise OSError."""
+    original = getattr(accessory, method)
+    failures = [count]
+
+    def call(*args):
+        if condition(*args) and failures[0]:
+            failures[0] -= 1
+            raise OSError(121, "Simulated accessory did not respond")
+        return original(*args)
+
+    setattr(accessory, method, call)
+
+
+def format_read(accessory):
+    # pylint: disable=protected-access
+    return lambda *args: accessory._pointer == 0xFE
+
+
+def format_write(data):
+    return len(data) == 2 and data[0] == 0xFE
+
+
+def test_values_are_scaled_up(simulated):
+    rng = random_frames(ClassicController, seed=0)
+    frames = [next(rng) for _ in range(FRAMES)]
+    default, _ = simulated(ClassicController, iter(frames))
+    high, _ = simulated(ClassicController, iter(frames), high_resolution=True)
+    assert not default.high_resolution
+    assert high.high_resolution
+    for _ in range(FRAMES):
+        expected = default.values
+        values = high.values
+        assert values.joysticks == (
+            expected.joysticks.rx << 3,
+            expected.joysticks.ry << 3,
+            expected.joysticks.lx << 2,
+            expected.joysticks.ly << 2,
+        )
+        assert values.triggers == (
+            expected.triggers.right << 3,
+            expected.triggers.left << 3,
+        )
+        assert values.buttons == expected.buttons
+        assert values.dpad == expected.dpad
+        assert high.buttons_mask == default.buttons_mask
+        expected = default.update()
+        state = high.update()
+        assert (state.lx, state.trigger_left) == (
+            expected.lx << 2,
+            expected.trigger_left << 3,
+        )
+        assert (state.A, state.dpad_up) == (expected.A, expected.dpad_up)
+
+
+def test_unsupported_format(simulated):
+    device, _ = simulated(
+        ClassicController,
+        random_frames(ClassicController, seed=0),
+        accessory_kwargs={"data_formats": (1,)},
+        high_resolution=True,
+    )
+    reference, _ = simulated(
+        ClassicController, random_frames(ClassicController, seed=0)
+    )
+    assert not device.high_resolution
+    for _ in range(20):
+        assert device.values == reference.values
+
+
+def test_format_write_nacked(simulated):
+    device, accessory = simulated(ClassicController, high_resolution=True)
+    failing(accessory, "write", format_write, 1)
+    device._init_accessory(fast=True)  # pylint: disable=protected-access
+    assert not device.high_resolution
+
+
+def test_format_readback_is_retried(simulated):
+    device, accessory = simulated(ClassicController, high_resolution=True)
+    failing(accessory, "read", format_read(accessory), 2)
+    device._init_accessory(fast=True)  # pylint: disable=protected-access
+    assert device.high_resolution
+
+
+def test_readback_failure_raises(simulated):
+    device, accessory = simulated(ClassicController, high_resolution=True)
+    failing(accessory, "read", format_read(accessory), 3)
+    with pytest.raises(OSError):
+        device._init_accessory(fast=True)  # pylint: disable=protected-access
+
+
+def test_format_after_replug(simulated):
+    device, accessory = simulated(
+        ClassicController, reconnect=True, high_resolution=True
+    )
+    expected = device.values
+    accessory.connected = False
+    device.values  # pylint: disable=pointless-statement
+    assert not device.connected
+    accessory.connected = True
+    deadline = time.monotonic() + 2
+    while not device.connected:
+        assert time.monotonic() < deadline, "timed out"
+        device.values  # pylint: disable=pointless-statement
+        time.sleep(0.01)
+    assert device.high_resolution
+    assert device.values == expected
+
+
+def test_record_and_replay(simulated, tmp_path):
+    path = tmp_path / "classic.wchk"
+    device, _ = simulated(
+        ClassicController,
+        random_frames(ClassicController, seed=0),
+        high_resolution=True,
+    )
+    with open(path, "wb") as log, Recorder(device, log):
+        recorded = [device.values for _ in range(FRAMES)]
+    with ReplayBus(str(path)) as bus:
+        assert bus.flags & FLAG_HIGH_RESOLUTION
+        replayed = bus.device()
+        assert replayed.high_resolution
+        assert [replayed.values for _ in range(FRAMES)] == recorded
+        del replayed
@@ -0,0 +1,25 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+from wiichuck.nunchuk import Nunchuk
+from wiichuck.simulator import encode, scripted_frames
+
+
+def test_memory_per_frame(simulated):
+    device, _ = simulated(Nunchuk, history=4)
+    # pylint: disable=protected-access
+    assert len(device.history._frames) == 4 * 8
+    assert device.history._timestamps.itemsize == 4
+
+
+def test_keeps_the_newest_frames(simulated):
+    frames = [encode(Nunchuk, joystick_x=x) for x in range(6)]
+    device, _ = simulated(Nunchuk, scripted_frames(frames, loop=False), history=4)
+    values = [device.values for _ in range(6)]
+    history = device.history
+    assert len(history) == 4
+    assert [history[index] for index in range(4)] == values[2:]
+    assert history[-1] == values[-1]
+    assert [sample for _, sample in history.window(2)] == values[4:]
+    assert history.elapsed(0) >= 0
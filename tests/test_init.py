@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=protected-access
+
+import pytest
+
+from wiichuck.nunchuk import Nunchuk
+from wiichuck.simulator import IDS, SimulatedAccessory, SimulatedI2C
+
+
+def nak_identity(accessory, count):
+    """Make ``accessory`` not acknowledge its next ``count`` identity reads,
+    or all of them when ``count`` is negative."""
+    original = accessory.read
+    failures = [count]
+
+    def read(buffer, start, end):
+        if accessory._pointer == 0xFA and failures[0]:
+            failures[0] -= 1
+            raise OSError(121, "Simulated accessory did not respond")
+        original(buffer, start, end)
+
+    accessory.read = read
+
+
+def test_fast_init():
+    accessory = SimulatedAccessory.for_device(Nunchuk, latency=0)
+    device = Nunchuk(SimulatedI2C(accessory), fast_init=True)
+    assert accessory.initialized
+    assert device.init_time < 0.5
+    assert device.device_id == IDS["Nunchuk"]
+
+
+def test_identity_read_retried():
+    accessory = SimulatedAccessory.for_device(Nunchuk, latency=0)
+    nak_identity(accessory, 3)
+    Nunchuk(SimulatedI2C(accessory), fast_init=True)
+    assert accessory.initialized
+
+
+def test_fast_init_timeout():
+    accessory = SimulatedAccessory.for_device(Nunchuk, latency=0)
+    device = Nunchuk(SimulatedI2C(accessory), fast_init=True)
+    nak_identity(accessory, -1)
+    with pytest.raises(OSError):
+        device._init_accessory(fast=True, timeout=0.02)
+
+
+def test_fast_init_invalid_identity():
+    accessory = SimulatedAccessory.for_device(Nunchuk, latency=0)
+    device = Nunchuk(SimulatedI2C(accessory), fast_init=True)
+    accessory.device_id = b"\xFF" * 6
+    with pytest.raises(RuntimeError):
+        device._init_accessory(fast=True, timeout=0.02)
@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=protected-access
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from wiichuck import layout
+from wiichuck.classic_controller import ClassicController
+from wiichuck.dj_table import DJTable
+from wiichuck.drums import Drums
+from wiichuck.guitar import Guitar
+from wiichuck.nunchuk import Nunchuk
+from wiichuck.udraw import UDraw
+
+LAYOUTS = (
+    Nunchuk._LAYOUT,
+    ClassicController._LAYOUT,
+    ClassicController._HIGH_RESOLUTION_LAYOUT,
+    Guitar._LAYOUT,
+    Drums._LAYOUT,
+    DJTable._LAYOUT,
+    UDraw._LAYOUT,
+)
+
+
+def frames(count=200):
+    rng = random.Random(0)
+    return [bytearray(rng.getrandbits(8) for _ in range(8)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("compiled", LAYOUTS)
+def test_closures_match_compiled(monkeypatch, compiled):
+    monkeypatch.setattr(layout, "_EXEC", False)
+    uncompiled = layout.Layout(compiled._values, compiled.buttons_byte)
+    assert uncompiled.buttons_mask == compiled.buttons_mask
+    assert uncompiled.buttons_invert == compiled.buttons_invert
+    names = compiled._values.tuple_class._fields
+    paths = names[::2]
+    state, expected = SimpleNamespace(), SimpleNamespace()
+    for frame in frames():
+        assert uncompiled.decode(frame) == compiled.decode(frame)
+        for name in names:
+            assert uncompiled.decoders[name](frame) == compiled.decoders[name](frame)
+        assert uncompiled.selector(paths)(frame) == compiled.selector(paths)(frame)
+        uncompiled.update(state, frame)
+        compiled.update(expected, frame)
+        assert vars(state) == vars(expected)
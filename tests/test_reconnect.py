@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import time
+
+import pytest
+
+from wiichuck.aio import AsyncWiiChuck
+from wiichuck.multi_chuck import MultiChuck
+from wiichuck.nunchuk import Nunchuk
+from wiichuck.simulator import (
+    SimulatedAccessory,
+    SimulatedI2C,
+    encode,
+    idle_frames,
+    scripted_frames,
+)
+
+
+def read_until(device, condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        device.values  # pylint: disable=pointless-statement
+        time.sleep(0.01)
+
+
+def test_raises_without_reconnect(simulated):
+    device, accessory = simulated(Nunchuk)
+    accessory.connected = False
+    with pytest.raises(OSError):
+        device.values  # pylint: disable=pointless-statement
+
+
+def test_unplug_and_plug_back(simulated):
+    device, accessory = simulated(Nunchuk, reconnect=True, stats=True)
+    events = []
+    device.on_disconnect = lambda device: events.append("disconnect")
+    device.on_connect = lambda device: events.append("connect")
+    idle = device.values
+
+    accessory.connected = False
+    assert device.values == idle  # the last frame, without raising
+    assert not device.connected
+    assert events == ["disconnect"]
+
+    accessory.connected = True
+    read_until(device, lambda: device.connected)
+    assert events == ["disconnect", "connect"]
+    assert accessory.initialized
+    assert device.values == idle
+    assert device.stats.reinits >= 1
+
+
+def test_invalid_frames_disconnect(simulated):
+    device, accessory = simulated(Nunchuk, reconnect=True)
+    device.values  # pylint: disable=pointless-statement
+    accessory.invalid_rate = 1.0
+    for _ in range(3):
+        device.values  # pylint: disable=pointless-statement
+    assert not device.connected
+    accessory.invalid_rate = 0.0
+    read_until(device, lambda: device.connected)
+
+
+def test_multi_chuck_replug():
+    accessories = [
+        SimulatedAccessory.for_device(Nunchuk, idle_frames(Nunchuk), latency=0),
+        SimulatedAccessory.for_device(
+            Nunchuk, scripted_frames([encode(Nunchuk, C=True)]), latency=0
+        ),
+    ]
+    players = MultiChuck(
+        [SimulatedI2C(accessory) for accessory in accessories],
+        ((0, Nunchuk), (1, Nunchuk)),
+        i2c_read_delay=0,
+        fast_init=True,
+        reconnect=True,
+    )
+    events = []
+    players.devices[0].on_disconnect = lambda device: events.append("disconnect")
+    players.devices[0].on_connect = lambda device: events.append("connect")
+    idle, pressed = players.poll()
+
+    accessories[0].connected = False
+    assert players.poll() == [idle, pressed]
+    assert not players.devices[0].connected
+    assert players.devices[1].connected
+    assert events == ["disconnect"]
+
+    accessories[0].connected = True
+    deadline = time.monotonic() + 2
+    while not players.devices[0].connected:
+        assert time.monotonic() < deadline, "timed out"
+        assert players.poll()[1] == pressed
+        time.sleep(0.01)
+    assert events == ["disconnect", "connect"]
+    assert accessories[0].initialized
+    assert players.poll() == [idle, pressed]
+
+
+def test_async_replug(simulated):
+    device, accessory = simulated(Nunchuk, reconnect=True)
+    wrapped = AsyncWiiChuck(device)
+
+    async def replug():
+        idle = await wrapped.read()
+        accessory.connected = False
+        assert await wrapped.read() == idle
+        assert not device.connected
+        accessory.connected = True
+        deadline = time.monotonic() + 2
+        while not device.connected:
+            assert time.monotonic() < deadline, "timed out"
+            assert await wrapped.read() == idle
+            await asyncio.sleep(0.01)
+        assert accessory.initialized
+
+    asyncio.run(replug())
+
+
+def test_begin_read_raises(simulated):
+    device, accessory = simulated(Nunchuk)
+    accessory.connected = False
+    with pytest.raises(OSError):
+        device.begin_read()
+    assert not device.connected
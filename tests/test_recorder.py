@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from wiichuck.classic_controller import ClassicController
+from wiichuck.nunchuk import Nunchuk
+from wiichuck.recorder import CompressedRecorder, Recorder, iter_log, read_header
+from wiichuck.replay import STEP, ReplayBus
+from wiichuck.simulator import random_frames
+
+FRAMES = 300
+
+
+def record(simulated, path, recorder_class, device_class=Nunchuk, **kwargs):
+    frames = random_frames(device_class, seed=0, change_rate=0.3)
+    device, _ = simulated(device_class, frames, **kwargs)
+    recorded = []
+    with open(path, "wb") as log, recorder_class(device, log, batch=16):
+        for _ in range(FRAMES):
+            recorded.append(device.values)
+    return device, recorded
+
+
+@pytest.mark.parametrize("recorder_class", (Recorder, CompressedRecorder))
+def test_round_trip(simulated, tmp_path, recorder_class):
+    path = tmp_path / "session.log"
+    device, recorded = record(simulated, path, recorder_class)
+    with open(path, "rb") as log:
+        compressed, device_type, device_id, _, _ = read_header(log)
+        assert compressed == (recorder_class is CompressedRecorder)
+        assert device_id == device.device_id
+        log.seek(0)
+        assert len(list(iter_log(log))) == FRAMES
+    with ReplayBus(str(path)) as bus:
+        assert bus.frame_count == FRAMES
+        assert bus.device_type == device_type
+        replayed = bus.device()
+        assert isinstance(replayed, Nunchuk)
+        assert [replayed.values for _ in range(FRAMES)] == recorded
+        with pytest.raises(EOFError):
+            replayed.values  # pylint: disable=pointless-statement
+        del replayed
+
+
+@pytest.mark.parametrize("recorder_class", (Recorder, CompressedRecorder))
+def test_seek(simulated, tmp_path, recorder_class):
+    path = tmp_path / "session.log"
+    _, recorded = record(simulated, path, recorder_class)
+    with ReplayBus(str(path)) as bus:
+        replayed = bus.device()
+        bus.seek(200)
+        assert replayed.values == recorded[200]
+        bus.seek(10)
+        assert replayed.values == recorded[10]
+        assert bus.position == 11
+        del replayed
+
+
+def test_step_mode(simulated, tmp_path):
+    path = tmp_path / "session.wchk"
+    _, recorded = record(simulated, path, Recorder)
+    with ReplayBus(str(path), mode=STEP) as bus:
+        replayed = bus.device()
+        assert replayed.values == recorded[0]
+        assert replayed.values == recorded[0]
+        bus.step()
+        assert replayed.values == recorded[1]
+        del replayed
+
+
+def test_classic_controller(simulated, tmp_path):
+    path = tmp_path / "classic.wchz"
+    _, recorded = record(simulated, path, CompressedRecorder, ClassicController)
+    with ReplayBus(str(path)) as bus:
+        replayed = bus.device()
+        assert isinstance(replayed, ClassicController)
+        assert [replayed.values for _ in range(FRAMES)] == recorded
+        del replayed
+
+
+@pytest.mark.parametrize("recorder_class", (Recorder, CompressedRecorder))
+def test_frame_outlives_the_log(simulated, tmp_path, recorder_class):
+    path = tmp_path / "session.log"
+    record(simulated, path, recorder_class)
+    with ReplayBus(str(path)) as bus:
+        frame = bus.frame(5)
+    assert isinstance(frame, bytes)
+    assert len(frame) == 8
@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+import random
+
+import pytest
+
+from wiichuck import simulator
+from wiichuck.classic_controller import ClassicController
+from wiichuck.dj_table import DJTable
+from wiichuck.drums import Drums
+from wiichuck.guitar import Guitar
+from wiichuck.nunchuk import Nunchuk
+from wiichuck.simulator import (
+    IDS,
+    SimulatedAccessory,
+    SimulatedI2C,
+    encode,
+    random_frames,
+    scripted_frames,
+)
+from wiichuck.udraw import UDraw
+
+DEVICE_CLASSES = (Nunchuk, ClassicController, Guitar, Drums, DJTable, UDraw)
+FRAME = bytes(range(1, 9))
+
+
+def read(bus, register, length=8):
+    buffer = bytearray(length)
+    bus.writeto(0x52, bytes((register,)))
+    bus.readfrom_into(0x52, buffer)
+    return bytes(buffer)
+
+
+def initialize(bus):
+    bus.writeto(0x52, b"\xF0\x55")
+    bus.writeto(0x52, b"\xFB\x00")
+
+
+def test_0xff_until_initialized():
+    bus = SimulatedI2C(SimulatedAccessory(scripted_frames([FRAME]), latency=0))
+    assert read(bus, 0x00) == b"\xFF" * 8
+    assert read(bus, 0xFA, 6) == b"\xFF" * 6
+    initialize(bus)
+    assert read(bus, 0x00) == FRAME
+
+
+def test_registers():
+    accessory = SimulatedAccessory(
+        scripted_frames([FRAME]), device_id=IDS["Guitar"], latency=0
+    )
+    bus = SimulatedI2C(accessory)
+    initialize(bus)
+    assert read(bus, 0xFA, 6) == IDS["Guitar"]
+    assert read(bus, 0x20, 16) == bytes(16)
+    assert read(bus, 0xFE, 1) == b"\x01"
+    # registers past the end of the data read as 0xFF
+    assert read(bus, 0xFE, 2) == b"\x01\xFF"
+
+
+def test_frames_served_in_order():
+    frames = [bytes((index,)) * 8 for index in range(3)]
+    bus = SimulatedI2C(SimulatedAccessory(scripted_frames(frames, loop=False)))
+    bus.accessories[0x52].latency = 0
+    initialize(bus)
+    assert [read(bus, 0x00) for _ in range(5)] == frames + [frames[-1]] * 2
+
+
+def test_early_read_returns_0xff():
+    bus = SimulatedI2C(SimulatedAccessory(scripted_frames([FRAME]), latency=10))
+    initialize(bus)
+    assert read(bus, 0x00) == b"\xFF" * 8
+
+
+def test_error_injection():
+    accessory = SimulatedAccessory(scripted_frames([FRAME]), latency=0, seed=1)
+    bus = SimulatedI2C(accessory)
+    initialize(bus)
+    accessory.error_rate = 1.0
+    with pytest.raises(OSError):
+        read(bus, 0x00)
+    accessory.error_rate = 0.5
+    errors = 0
+    for _ in range(200):
+        try:
+            read(bus, 0x00)
+        except OSError:
+            errors += 1
+    assert 0 < errors < 200
+
+
+def test_invalid_frame_injection():
+    accessory = SimulatedAccessory(
+        scripted_frames([FRAME]), latency=0, invalid_rate=1.0
+    )
+    bus = SimulatedI2C(accessory)
+    initialize(bus)
+    assert read(bus, 0x00) == b"\xFF" * 8
+
+
+def test_unplug_requires_a_new_init():
+    accessory = SimulatedAccessory(scripted_frames([FRAME]), latency=0)
+    bus = SimulatedI2C(accessory)
+    initialize(bus)
+    assert bus.scan() == [0x52]
+    accessory.connected = False
+    assert not bus.scan()
+    with pytest.raises(OSError):
+        read(bus, 0x00)
+    accessory.connected = True
+    assert read(bus, 0x00) == b"\xFF" * 8
+    initialize(bus)
+    assert read(bus, 0x00) == FRAME
+
+
+def test_missing_address():
+    bus = SimulatedI2C(SimulatedAccessory(scripted_frames([FRAME])))
+    with pytest.raises(OSError):
+        bus.writeto(0x53, b"\x00")
+
+
+def test_lock():
+    bus = SimulatedI2C()
+    assert bus.try_lock()
+    assert not bus.try_lock()
+    bus.unlock()
+    assert bus.try_lock()
+
+
+@pytest.mark.parametrize("device_class", DEVICE_CLASSES)
+def test_idle_frame(device_class, simulated):
+    device, _ = simulated(device_class)
+    assert device.buttons_mask == 0
+    assert device.device_id == IDS[device_class.__name__]
+
+
+@pytest.mark.parametrize("device_class", DEVICE_CLASSES)
+def test_encode_round_trip(device_class, simulated):
+    # pylint: disable=protected-access
+    spec = simulator._FIELDS[device_class.__name__]
+    rng = random.Random(device_class.__name__)
+    device, accessory = simulated(device_class)
+    for _ in range(200):
+        fields = {}
+        for field, limits in spec.items():
+            if limits is None:
+                fields[field] = rng.random() < 0.5
+            else:
+                fields[field] = rng.randint(limits[1], limits[2])
+        accessory.frames = scripted_frames([encode(device_class, **fields)])
+        state = device.update()
+        for field, value in fields.items():
+            assert getattr(state, field) == value, field
+
+
+@pytest.mark.parametrize("device_class", DEVICE_CLASSES)
+def test_random_frames_reproducible(device_class):
+    first = random_frames(device_class, seed=3)
+    second = random_frames(device_class, seed=3)
+    assert [next(first) for _ in range(10)] == [next(second) for _ in range(10)]
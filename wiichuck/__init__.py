@@ -29,14 +29,51 @@ Implementation Notes
 """
 import time
 from adafruit_bus_device.i2c_device import I2CDevice
+from wiichuck.history import FrameHistory
+from wiichuck.stats import ReadStats
 
 __version__ = "0.0.0-auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
 
 _I2C_INIT_DELAY = 0.1
+_I2C_INIT_TIMEOUT = 0.5
+_I2C_INIT_POLL_INTERVAL = 0.001
+_DISCONNECT_INVALID_FRAMES = 3
+_RECONNECT_MIN_DELAY = 0.05
+_RECONNECT_MAX_DELAY = 2.0
 
+_INVALID_FRAME = b"\xFF" * 8
 
-class WiiChuckBase:  # pylint: disable=too-few-public-methods
+
+class WiiChuckState:  # pylint: disable=too-few-public-methods
+    """
+    Base Class for the mutable state objects that device classes update in
+    place from ``update()``, so polling does not allocate new values.
+
+    Subclasses only list their fields in ``__slots__``.
+
+    :param layout: The `wiichuck.layout.Layout` of the device, used to start
+        buttons as False and values as 0. Without it every field is 0.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, layout=None):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+        if layout is not None:
+            layout.reset(self)
+
+    def __repr__(self):
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join(
+                "{}={}".format(name, getattr(self, name)) for name in self.__slots__
+            ),
+        )
+
+
+class WiiChuckBase:  # pylint: disable=too-many-public-methods,too-many-instance-attributes
     """
     Base Class which provides interface to Nintendo Nunchuk Accessories.
 
@@ -48,26 +85,614 @@ class WiiChuckBase:  # pylint: disable=too-few-public-methods
         conservative default of 2000us is used since some hosts may
         not be able to achieve such timing.
     :type i2c_read_delay: float, optional
+    :param pipelined: When True, the register pointer for the next frame is
+        written right after each read so the following read only needs to
+        wait out whatever is left of ``i2c_read_delay``. Each frame is then
+        sampled when the previous read finished rather than when it is
+        requested. Default is False.
+    :type pipelined: bool, optional
+    :param fast_init: When True, the accessory is initialized as soon as it
+        acknowledges the init writes and returns a valid identity instead of
+        after two fixed 100ms pauses. See `init_time`. Default is False.
+    :type fast_init: bool, optional
+    :param history: The number of frames to keep in `history`, allocated
+        upfront at 12 bytes per frame. Default is 0, no history.
+    :type history: int, optional
+    :param stats: When True, reads are timed and counted in `stats`.
+        Default is False.
+    :type stats: bool, optional
+    :param reconnect: When True, reads of a disconnected accessory return
+        right away with the last frame instead of raising `OSError`, and the
+        accessory is re-initialized in the background of later reads with
+        an exponential backoff. See `connected`. Default is False.
+    :type reconnect: bool, optional
     """
 
-    def __init__(self, i2c, address=0x52, i2c_read_delay=0.002):
+    # buttons_mask bits: bit n of byte 5 is bit n, bit n of byte 4 is bit n + 8,
+    # or of the bytes following _BUTTONS_BYTE for other data formats
+    _BUTTONS_BYTE = 4
+    _BUTTONS_MASK = 0x0000
+    _BUTTONS_INVERT = 0xFFFF  # buttons are active low
+    # the wiichuck.layout.Layout of the frames, set by each device class
+    _LAYOUT = None
+    # the WiiChuckState filled by update(), set by each device class
+    state = None
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        i2c,
+        address=0x52,
+        i2c_read_delay=0.002,
+        pipelined=False,
+        fast_init=False,
+        history=0,
+        stats=False,
+        reconnect=False,
+    ):
         self.buffer = bytearray(8)
-        self.i2c_device = I2CDevice(i2c, address)
+        self._id_buffer = bytearray(6)
+        self.i2c_device = I2CDevice(i2c, address, probe=not fast_init)
         self._i2c_read_delay = i2c_read_delay
-        time.sleep(_I2C_INIT_DELAY)
-        with self.i2c_device as i2c_dev:
-            # turn off encrypted data
-            # http://wiibrew.org/wiki/Wiimote/Extension_Controllers
-            i2c_dev.write(b"\xF0\x55")
+        self._pipelined = pipelined
+        self._read_deadline = None
+        self._last_frame = None
+        self._frame_time = 0
+        self._changed = True
+        self._change_count = 0
+        self._decoded = None
+        self._decoded_count = -1
+        self._state_count = -1
+        self._events_mask = 0
+        self._frame_listeners = []
+        self.history = FrameHistory(self, history) if history else None
+        self._stats = ReadStats() if stats else None
+        self._reconnect = reconnect
+        self._connected = True
+        self._invalid_frames = 0
+        self._retry_delay = _RECONNECT_MIN_DELAY
+        self._retry_at = 0
+        self.on_connect = None
+        self.on_disconnect = None
+        self._init_time = None
+        self._init_accessory(fast_init)
+
+    def _init_accessory(self, fast=False, timeout=_I2C_INIT_TIMEOUT):
+        start = time.monotonic_ns()
+        if self._stats is not None and self._init_time is not None:
+            self._stats.reinits += 1
+        self._read_deadline = None
+        if fast:
+            self._fast_init(start + int(timeout * 1e9))
+        else:
             time.sleep(_I2C_INIT_DELAY)
-            i2c_dev.write(b"\xFB\x00")
+            with self.i2c_device as i2c_dev:
+                # turn off encrypted data
+                # http://wiibrew.org/wiki/Wiimote/Extension_Controllers
+                i2c_dev.write(b"\xF0\x55")
+                time.sleep(_I2C_INIT_DELAY)
+                i2c_dev.write(b"\xFB\x00")
+        self._init_time = (time.monotonic_ns() - start) / 1e9
+
+    def _fast_init(self, deadline):
+        """Initializes the accessory as soon as it responds instead of
+        waiting a fixed time, raising an error once ``deadline`` passes."""
+        self._write_until_ack(b"\xF0\x55", deadline)
+        self._write_until_ack(b"\xFB\x00", deadline)
+        while True:
+            try:
+                if self._read_register(b"\xFA", self._id_buffer) != _INVALID_FRAME[:6]:
+                    return
+            except OSError:
+                if time.monotonic_ns() > deadline:
+                    raise
+            if time.monotonic_ns() > deadline:
+                raise RuntimeError("Timed out waiting for the accessory identity")
+            time.sleep(_I2C_INIT_POLL_INTERVAL)
+
+    def _write_until_ack(self, command, deadline):
+        while True:
+            try:
+                with self.i2c_device as i2c_dev:
+                    i2c_dev.write(command)
+                return
+            except OSError:
+                if time.monotonic_ns() > deadline:
+                    raise
+                time.sleep(_I2C_INIT_POLL_INTERVAL)
+
+    @property
+    def init_time(self):
+        """The time in seconds the accessory initialization took."""
+        return self._init_time
+
+    @property
+    def stats(self):
+        """A snapshot of the read counters, None unless created with ``stats=True``.
+
+        See `wiichuck.stats.ReadStats.snapshot`.
+        """
+        if self._stats is None:
+            return None
+        return self._stats.snapshot()
+
+    def reset_stats(self):
+        """Zero the read counters."""
+        if self._stats is not None:
+            self._stats.reset()
+
+    @property
+    def i2c_read_delay(self):
+        """The time in seconds to pause between the I2C write and read."""
+        return self._i2c_read_delay
+
+    @i2c_read_delay.setter
+    def i2c_read_delay(self, value):
+        self._i2c_read_delay = value
+        self._read_deadline = None
+
+    @property
+    def pipelined(self):
+        """Whether the register pointer is prefetched after each read."""
+        return self._pipelined
+
+    @property
+    def device_id(self):
+        """The 6 byte extension controller identifier."""
+        return bytes(self._read_register(b"\xFA", self._id_buffer))
+
+    def calibrate_read_delay(  # pylint: disable=too-many-arguments
+        self, minimum=0.0, samples=16, resolution=0.00005, margin=0.0001, cache=None
+    ):
+        """Find the shortest ``i2c_read_delay`` that still reads valid frames.
+
+        First reads ``samples`` reference frames at the current
+        ``i2c_read_delay``, then binary searches between ``minimum`` and it
+        for the shortest delay at which ``samples`` reads in a row all
+        succeed and return one of the reference frames, so that frames read
+        too early, whether all 0xFF, stale or half updated, are rejected.
+        Adds ``margin`` and uses the result as the new ``i2c_read_delay``.
+        Leave the accessory untouched while calibrating.
+
+        :param float minimum: The shortest delay in seconds to try.
+        :param int samples: The number of reads that must all be valid.
+        :param float resolution: Stop searching once the range is this narrow.
+        :param float margin: The safety margin in seconds added to the result.
+        :param dict cache: Results keyed by the hex `device_id`. If it already
+            holds this device the search is skipped, otherwise the result is
+            stored in it so it can be saved and passed in again on later boots.
+        :return: The new ``i2c_read_delay``. The delay is left unchanged if
+            the search fails.
+        """
+        key = None
+        if cache is not None:
+            key = self.device_id.hex()
+            if key in cache:
+                self.i2c_read_delay = cache[key]
+                return self._i2c_read_delay
+
+        original = self._i2c_read_delay
+        calibrated = None
+        try:
+            reference = set()
+            for _ in range(samples):
+                reference.add(bytes(self._read_register(b"\x00")))
+            reference.discard(_INVALID_FRAME)
+            if not reference:
+                raise RuntimeError("No valid frames at the current i2c_read_delay")
+            low = minimum
+            high = original
+            while high - low > resolution:
+                delay = (low + high) / 2
+                if self._frames_valid(delay, samples, reference):
+                    high = delay
+                else:
+                    low = delay
+            calibrated = high + margin
+        finally:
+            self.i2c_read_delay = original if calibrated is None else calibrated
+
+        if cache is not None:
+            cache[key] = self._i2c_read_delay
+        return self._i2c_read_delay
+
+    def _frames_valid(self, delay, samples, reference):
+        self.i2c_read_delay = delay
+        for _ in range(samples):
+            try:
+                frame = self._read_register(b"\x00")
+            except OSError:
+                # many accessories do not acknowledge reads that come too early
+                return False
+            if bytes(frame) not in reference:
+                return False
+        return True
+
+    def begin_read(self):
+        """Start reading a frame without blocking.
+
+        Writes the register pointer and returns immediately. Call
+        `finish_read` once `poll_ready` returns True, then use the device
+        class's ``decode()`` to get the values without another bus
+        transaction.
+
+        With ``reconnect=True`` nothing is written while the accessory is
+        disconnected, `finish_read` then tries to reconnect it.
+        """
+        self._read_deadline = None
+        if self._reconnect and not self._connected:
+            return
+        try:
+            with self.i2c_device as i2c:
+                i2c.write(b"\x00")
+        except OSError:
+            if self._stats is not None:
+                self._stats.errors += 1
+            self._set_connected(False)
+            if not self._reconnect:
+                raise
+            return
+        self._set_deadline()
+
+    def poll_ready(self):
+        """Whether the frame started with `begin_read` can be read without waiting."""
+        return (
+            self._read_deadline is not None
+            and time.monotonic_ns() >= self._read_deadline
+        )
+
+    def finish_read(self):
+        """Complete the read started with `begin_read`.
+
+        Sleeps for whatever is left of ``i2c_read_delay`` if `poll_ready` is
+        not True yet. Does a full blocking read if no read was started.
+        """
+        return self._read_data()
+
+    @property
+    def buttons_mask(self):
+        """The current pressed state of all buttons as one integer.
+
+        Test it against the device class's ``BTN_`` constants.
+        """
+        return self._buttons_mask()
+
+    def _buttons_mask(self, do_read=True):
+        if do_read:
+            self._read_data()
+        byte = self._BUTTONS_BYTE
+        return (
+            (self.buffer[byte] << 8 | self.buffer[byte + 1]) ^ self._BUTTONS_INVERT
+        ) & self._BUTTONS_MASK
+
+    def button_events(self, do_read=True):
+        """Returns an iterator of ``(timestamp_ns, button, pressed)`` events,
+        one for each button that was pressed or released since the previous
+        call.
+
+        ``button`` is one of the device class's ``BTN_`` constants and
+        ``timestamp_ns`` is the `time.monotonic_ns` at which the frame was
+        read. The frame is read when this is called, not when iterating.
+
+        :param bool do_read: Read a new frame first. Use False to get the
+            events of the frame already read by ``values`` or `finish_read`.
+        """
+        mask = self._buttons_mask(do_read)
+        changes = mask ^ self._events_mask
+        self._events_mask = mask
+        return _events(self._frame_time, mask, changes)
+
+    def add_frame_listener(self, listener):
+        """Call ``listener(device)`` with this device after every frame read."""
+        self._frame_listeners.append(listener)
+
+    def remove_frame_listener(self, listener):
+        """Stop calling a listener added with `add_frame_listener`."""
+        self._frame_listeners.remove(listener)
+
+    @property
+    def changed(self):
+        """Whether the last frame read differs from the one before it."""
+        return self._changed
+
+    @property
+    def change_count(self):
+        """The number of frames read that differed from the one before them."""
+        return self._change_count
+
+    def decode(self):
+        """Decode all values from the last frame read without another bus transaction.
+
+        Use after `finish_read` to get the values of a split-phase read. The
+        decoded values are cached and returned again as long as the frames
+        read are unchanged.
+        """
+        if self._decoded_count != self._change_count:
+            self._decoded = self._decode()
+            self._decoded_count = self._change_count
+        return self._decoded
+
+    def decode_frame(self, frame):
+        """Decode all values from any raw ``frame``, such as one from `history`,
+        without touching the last frame read."""
+        if self._LAYOUT is None:
+            raise NotImplementedError()
+        return self._LAYOUT.decode(frame)
+
+    def _decode(self):
+        if self._LAYOUT is None:
+            raise NotImplementedError()
+        return self._LAYOUT.decode(self.buffer)
+
+    def _value(self, name, do_read=True):
+        if do_read:
+            self._read_data()
+        return self._LAYOUT.decoders[name](self.buffer)
+
+    def reader(self, fields):
+        """Return a function that reads a frame and decodes only ``fields``.
+
+        Decoding a few fields costs a fraction of decoding all of `values`:
+
+        .. code-block:: python
+
+            read = controller.reader(("joysticks.lx", "joysticks.ly", "buttons.A"))
+            while True:
+                x, y, a = read()
+
+        :param fields: A dotted path into `values`, such as ``"buttons.A"``
+            or ``"dpad"``, or a sequence of them.
+        :return: A function taking ``do_read=True``, like the single value
+            properties, and returning the value of ``fields``, or a tuple of
+            the values when ``fields`` is a sequence.
+        """
+        single = isinstance(fields, str)
+        paths = (fields,) if single else tuple(fields)
+        layout = self._LAYOUT
+        select = layout.selector(paths)
+
+        def read(do_read=True):
+            nonlocal layout, select
+            if do_read:
+                self._read_data()
+            if self._LAYOUT is not layout:
+                # the accessory changed its data format
+                layout = self._LAYOUT
+                select = layout.selector(paths)
+            values = select(self.buffer)
+            return values[0] if single else values
+
+        return read
+
+    @property
+    def values(self):
+        """The current state of all values."""
+        self._read_data()
+        return self.decode()
+
+    def update(self):
+        """Read a frame and update ``state`` in place without allocating new values.
+
+        Decoding is skipped when ``state`` already holds the frame read,
+        see `change_count`.
+        """
+        buffer = self._read_data()
+        if self._state_count != self._change_count:
+            self._LAYOUT.update(self.state, buffer)
+            self._state_count = self._change_count
+        return self.state
+
+    @property
+    def connected(self):
+        """Whether the accessory is responding.
+
+        It is considered disconnected when a read raises `OSError` or
+        returns several all 0xFF frames in a row. The ``on_connect`` and
+        ``on_disconnect`` attributes, when set, are called with the device
+        whenever this changes.
+        """
+        return self._connected
+
+    def _set_connected(self, connected):
+        if connected == self._connected:
+            return
+        self._connected = connected
+        self._invalid_frames = 0
+        if connected:
+            self._retry_delay = _RECONNECT_MIN_DELAY
+        else:
+            self._retry_at = time.monotonic_ns()
+        callback = self.on_connect if connected else self.on_disconnect
+        if callback is not None:
+            callback(self)
+
+    def _try_reconnect(self):
+        """Re-initializes a disconnected accessory once its retry time has
+        come, without waiting for it to respond."""
+        now = time.monotonic_ns()
+        if now < self._retry_at:
+            return False
+        try:
+            self._init_accessory(fast=True, timeout=0)
+        except (OSError, RuntimeError):
+            self._retry_at = now + int(self._retry_delay * 1e9)
+            self._retry_delay = min(self._retry_delay * 2, _RECONNECT_MAX_DELAY)
+            return False
+        self._set_connected(True)
+        return True
 
     def _read_data(self):
-        return self._read_register(b"\x00")
+        if self._reconnect and not self._connected and not self._try_reconnect():
+            self._changed = False
+            return self.buffer
+        try:
+            self._read_register(b"\x00")
+        except OSError:
+            self._set_connected(False)
+            if not self._reconnect:
+                raise
+            self._changed = False
+            return self.buffer
+        return self._process_data()
 
-    def _read_register(self, address):
-        with self.i2c_device as i2c:
-            i2c.write(address)
-            time.sleep(self._i2c_read_delay)  # at least 200us
-            i2c.readinto(self.buffer)
+    def _process_data(self):
+        """Called with each new frame in ``buffer``; tracks whether it changed
+        and passes it on to the frame listeners."""
+        self._frame_time = time.monotonic_ns()
+        if self._last_frame is None:
+            self._last_frame = bytearray(self.buffer)
+            self._changed = True
+        else:
+            self._changed = self.buffer != self._last_frame
+            if self._changed:
+                self._last_frame[:] = self.buffer
+        if self._changed:
+            self._change_count += 1
+        invalid = self.buffer == _INVALID_FRAME
+        if invalid:
+            self._invalid_frames += 1
+            if self._invalid_frames >= _DISCONNECT_INVALID_FRAMES:
+                self._set_connected(False)
+        else:
+            self._invalid_frames = 0
+            if not self._connected:
+                self._set_connected(True)
+        if self._stats is not None:
+            self._stats.add_frame(invalid)
+        if self.history is not None:
+            self.history.append(self.buffer)
+        if self._frame_listeners:
+            for listener in self._frame_listeners:
+                listener(self)
         return self.buffer
+
+    def _read_register(self, address, buffer=None):
+        if self._stats is None:
+            return self._transfer(address, buffer)
+        start = time.monotonic_ns()
+        try:
+            buffer = self._transfer(address, buffer)
+        except OSError:
+            self._stats.errors += 1
+            raise
+        self._stats.add_read(time.monotonic_ns() - start)
+        return buffer
+
+    def _transfer(self, address, buffer):
+        if buffer is None:
+            buffer = self.buffer
+        prefetched = self._read_deadline is not None and address == b"\x00"
+        if prefetched:
+            # the pointer was already written right after the previous read
+            self._wait_for_deadline()
+        try:
+            with self.i2c_device as i2c:
+                if not prefetched:
+                    i2c.write(address)
+                    time.sleep(self._i2c_read_delay)  # at least 200us
+                i2c.readinto(buffer)
+                if self._pipelined and address == b"\x00":
+                    i2c.write(address)
+                    self._set_deadline()
+                else:
+                    self._read_deadline = None
+        except OSError:
+            # the pointer may not have been written, write it again next time
+            self._read_deadline = None
+            raise
+        return buffer
+
+    def _set_deadline(self):
+        self._read_deadline = time.monotonic_ns() + int(self._i2c_read_delay * 1e9)
+
+    def _wait_for_deadline(self):
+        remaining = self._read_deadline - time.monotonic_ns()
+        if remaining > 0:
+            time.sleep(remaining / 1e9)
+
+
+def _events(timestamp, mask, changes):
+    button = 1
+    while changes:
+        if changes & button:
+            yield timestamp, button, bool(mask & button)
+            changes ^= button
+        button <<= 1
+
+
+def device_class(device_id):
+    """The device class for a 6 byte extension controller identifier.
+
+    :param bytes device_id: The identifier, as read by `WiiChuckBase.device_id`.
+    :raises ValueError: For accessories this library does not support.
+    """
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    kind = device_id[5]
+    variant = device_id[0]
+    if kind == 0x00:
+        from wiichuck.nunchuk import Nunchuk
+
+        return Nunchuk
+    if kind == 0x01:
+        from wiichuck.classic_controller import ClassicController
+
+        return ClassicController
+    if kind == 0x03 and variant == 0x00:
+        from wiichuck.guitar import Guitar
+
+        return Guitar
+    if kind == 0x03 and variant == 0x01:
+        from wiichuck.drums import Drums
+
+        return Drums
+    if kind == 0x03 and variant == 0x03:
+        from wiichuck.dj_table import DJTable
+
+        return DJTable
+    if kind == 0x12:
+        from wiichuck.udraw import UDraw
+
+        return UDraw
+    raise ValueError("Unsupported accessory id: {}".format(bytes(device_id).hex()))
+
+
+def identify(i2c, address=0x52, cache=None):
+    """Find the device class of the accessory plugged in.
+
+    Initializes the accessory and reads its identifier. With a ``cache``,
+    the class found is kept in it so that later calls for the same bus and
+    address, such as after a reconnect, do not touch the bus.
+
+    :param i2c: The `busio.I2C` object to use.
+    :param address: The I2C address of the device. Default is 0x52.
+    :type address: int, optional
+    :param dict cache: The classes found, keyed by ``(i2c, address)``, which
+        keeps the bus objects alive as long as the dict. Clear an entry to
+        detect again after swapping accessories. Default is None, no cache.
+    """
+    key = (i2c, address)
+    if cache is None or key not in cache:
+        accessory = WiiChuckBase(i2c, address=address, fast_init=True)
+        found = device_class(accessory.device_id)
+        if cache is None:
+            return found
+        cache[key] = found
+    return cache[key]
+
+
+def create(i2c, address=0x52, cache=None, **kwargs):
+    """Create the right device class for the accessory plugged in.
+
+    .. code-block:: python
+
+        controller = wiichuck.create(board.I2C())
+        print(type(controller).__name__, controller.values)
+
+    :param i2c: The `busio.I2C` object to use.
+    :param address: The I2C address of the device. Default is 0x52.
+    :type address: int, optional
+    :param dict cache: See `identify`.
+    :param kwargs: Passed on to the device class. ``fast_init`` defaults to
+        True since the accessory was just initialized to identify it.
+    """
+    kwargs.setdefault("fast_init", True)
+    return identify(i2c, address=address, cache=cache)(i2c, address=address, **kwargs)
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`wiichuck.aio`
+================================================================================
+
+asyncio support for Nintento WiiMote I2C Accessory Devices
+
+
+* Author(s): John Furcean
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+* Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+* Adafruit's asyncio library: https://github.com/adafruit/Adafruit_CircuitPython_asyncio
+"""
+import time
+import asyncio
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
+
+
+class AsyncWiiChuck:
+    """
+    Wraps a device so that reads await the ``i2c_read_delay`` with
+    ``asyncio.sleep`` instead of blocking the event loop.
+
+    :param device: The `wiichuck.WiiChuckBase` device to read, for example
+        a `wiichuck.nunchuk.Nunchuk`.
+    """
+
+    def __init__(self, device):
+        self.device = device
+
+    async def read(self):
+        """Read a frame and return the device's decoded values."""
+        self.device.begin_read()
+        await asyncio.sleep(self.device.i2c_read_delay)
+        self.device.finish_read()
+        return self.device.decode()
+
+    def stream(self, rate_hz=100):
+        """An asynchronous iterator reading the device's values at ``rate_hz``.
+
+        .. code-block:: python
+
+            async for values in AsyncWiiChuck(nunchuk).stream(rate_hz=200):
+                print(values.joystick)
+
+        :param float rate_hz: The number of reads per second. Reads happen as
+            often as possible if the event loop cannot keep up.
+        """
+        return _Stream(self, rate_hz)
+
+
+class _Stream:
+    def __init__(self, chuck, rate_hz):
+        self._chuck = chuck
+        self._period = int(1e9 / rate_hz)
+        self._next = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        now = time.monotonic_ns()
+        if self._next is None or now - self._next > self._period:
+            # first read or fell behind, restart the schedule from now
+            self._next = now
+        elif self._next > now:
+            await asyncio.sleep((self._next - now) / 1e9)
+        self._next += self._period
+        return await self._chuck.read()
@@ -0,0 +1,187 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`wiichuck.batch`
+================================================================================
+
+Vectorized decoding of many recorded frames at once with NumPy, for offline
+analysis. Frames are an ``(N, 8)`` ``uint8`` array, such as the frame
+column of a `wiichuck.recorder` log, and every decoder returns a dict of
+columns named like the fields of the matching device's ``state``. The
+columns are built from the same `wiichuck.layout.Layout` as the device
+classes' decoders. Requires NumPy, which is not available in CircuitPython.
+
+
+* Author(s): John Furcean
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* NumPy: https://numpy.org
+"""
+import numpy as np
+from wiichuck.classic_controller import ClassicController
+from wiichuck.dj_table import DJTable
+from wiichuck.drums import Drums
+from wiichuck.guitar import Guitar
+from wiichuck.layout import Button
+from wiichuck.nunchuk import Nunchuk
+from wiichuck.recorder import FLAG_HIGH_RESOLUTION, HEADER_SIZE, read_header
+from wiichuck.udraw import UDraw
+
+# pylint: disable=protected-access
+
+_RECORD_DTYPE = np.dtype(
+    [("delta", "<u4"), ("device_type", "u1"), ("frame", "u1", (8,))]
+)
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
+
+
+def _columns(frames):
+    frames = np.asarray(frames, dtype=np.uint8)
+    if frames.ndim != 2 or frames.shape[1] < 6:
+        raise ValueError("frames must be an (N, 6) or (N, 8) uint8 array")
+    return [frames[:, index].astype(np.int16) for index in range(frames.shape[1])]
+
+
+def _column(b, member):
+    """The NumPy equivalent of the scalar decoder of a `Field` or `Button`."""
+    if isinstance(member, Button):
+        if member.active_low:
+            return (b[member.byte] & member.mask) == 0
+        return (b[member.byte] & member.mask) != 0
+    value = 0
+    for byte, mask, shift in member.parts:
+        part = b[byte] & mask
+        value = value | (part >> shift if shift >= 0 else part << -shift)
+    if member.sign is not None:
+        value = np.where(b[member.sign[0]] & member.sign[1], -value, value)
+    return value
+
+
+def _decode_columns(b, layout):
+    try:
+        return {slot: _column(b, member) for slot, member in layout.leaves}
+    except IndexError:
+        raise ValueError("frames must be an (N, 8) uint8 array") from None
+
+
+def decode_layout(frames, layout):
+    """Decode frames described by any `wiichuck.layout.Layout`.
+
+    :return: A dict with one column per `Field` and `Button` of ``layout``,
+        named like the fields of the matching ``state``.
+    """
+    return _decode_columns(_columns(frames), layout)
+
+
+def decode_nunchuk(frames):
+    """Decode `wiichuck.nunchuk.Nunchuk` frames."""
+    return decode_layout(frames, Nunchuk._LAYOUT)
+
+
+def decode_classic_controller(frames, high_resolution=False):
+    """Decode `wiichuck.classic_controller.ClassicController` frames,
+    including the third party controller fix up.
+
+    :param bool high_resolution: Decode frames of the high resolution data
+        format instead, see `decode` to pick it from the log flags.
+    """
+    if high_resolution:
+        return decode_layout(frames, ClassicController._HIGH_RESOLUTION_LAYOUT)
+    b = _columns(frames)
+    if len(b) == 8:
+        third_party = (b[4] == 0) & (b[5] == 0)
+        b[4] = np.where(third_party, b[6], b[4])
+        b[5] = np.where(third_party, b[7], b[5])
+    return _decode_columns(b, ClassicController._LAYOUT)
+
+
+def decode_guitar(frames):
+    """Decode `wiichuck.guitar.Guitar` frames."""
+    return decode_layout(frames, Guitar._LAYOUT)
+
+
+def decode_drums(frames):
+    """Decode `wiichuck.drums.Drums` frames."""
+    return decode_layout(frames, Drums._LAYOUT)
+
+
+def decode_dj_table(frames):
+    """Decode `wiichuck.dj_table.DJTable` frames."""
+    return decode_layout(frames, DJTable._LAYOUT)
+
+
+def decode_udraw(frames):
+    """Decode `wiichuck.udraw.UDraw` frames."""
+    return decode_layout(frames, UDraw._LAYOUT)
+
+
+DECODERS = {
+    "Nunchuk": decode_nunchuk,
+    "ClassicController": decode_classic_controller,
+    "Guitar": decode_guitar,
+    "Drums": decode_drums,
+    "DJTable": decode_dj_table,
+    "UDraw": decode_udraw,
+}
+"""The batch decoders keyed by device class name."""
+
+
+def decode(frames, device_class, flags=0):
+    """Decode frames with the batch decoder for ``device_class``.
+
+    .. code-block:: python
+
+        records, flags = load_log("session.wchk")
+        columns = decode(records["frame"], ClassicController, flags)
+
+    :param frames: An ``(N, 8)`` ``uint8`` array.
+    :param device_class: A device class, such as
+        `wiichuck.nunchuk.Nunchuk`, or its name.
+    :param int flags: The header flags of the log the frames come from, as
+        returned by `load_log`, which select the data format.
+    :return: A dict of NumPy columns, one entry per frame.
+    """
+    name = device_class if isinstance(device_class, str) else device_class.__name__
+    if flags & FLAG_HIGH_RESOLUTION:
+        if name != "ClassicController":
+            raise ValueError("{} has no high resolution format".format(name))
+        return decode_classic_controller(frames, high_resolution=True)
+    return DECODERS[name](frames)
+
+
+def load_log(path):
+    """Memory-map the records of an uncompressed `wiichuck.recorder` log.
+
+    :return: A ``(records, flags)`` tuple: a structured array with
+        ``delta``, ``device_type`` and ``frame`` fields, where
+        ``records["frame"]`` is the ``(N, 8)`` array taken by the decoders,
+        and the header flags of the log.
+    :raises ValueError: For compressed logs and files that are not logs.
+    """
+    with open(path, "rb") as log:
+        compressed, _, _, _, flags = read_header(log)
+    if compressed:
+        raise ValueError(
+            "Compressed logs cannot be memory-mapped, replay them with "
+            "wiichuck.replay.ReplayBus or wiichuck.recorder.iter_log"
+        )
+    return np.memmap(path, dtype=_RECORD_DTYPE, mode="r", offset=HEADER_SIZE), flags
+
+
+def to_structured(columns):
+    """Combine a dict of columns returned by a decoder into one structured array."""
+    names = list(columns)
+    array = np.empty(
+        len(columns[names[0]]), dtype=[(name, columns[name].dtype) for name in names]
+    )
+    for name in names:
+        array[name] = columns[name]
+    return array
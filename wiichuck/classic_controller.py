@@ -26,13 +26,46 @@ Implementation Notes
 * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
 """
 from collections import namedtuple
-from wiichuck import WiiChuckBase
+from wiichuck import WiiChuckBase, WiiChuckState, _I2C_INIT_TIMEOUT
+from wiichuck.layout import Button, Field, Group, Layout
 
 __version__ = "0.0.0-auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
 
 
 _THIRD_PARTY_SIGNATURE = bytearray((0x00, 0x00))
+_HIGH_RESOLUTION_FORMAT = 0x03
+_FORMAT_READ_ATTEMPTS = 3
+
+
+class ClassicControllerState(WiiChuckState):  # pylint: disable=too-few-public-methods
+    """Mutable state of a `ClassicController`, updated in place by `ClassicController.update`."""
+
+    __slots__ = (
+        "rx",
+        "ry",
+        "lx",
+        "ly",
+        "A",
+        "B",
+        "X",
+        "Y",
+        "R",
+        "L",
+        "ZR",
+        "ZL",
+        "start",
+        "select",
+        "home",
+        "plus",
+        "minus",
+        "dpad_up",
+        "dpad_down",
+        "dpad_right",
+        "dpad_left",
+        "trigger_right",
+        "trigger_left",
+    )
 
 
 class ClassicController(WiiChuckBase):
@@ -47,8 +80,47 @@ class ClassicController(WiiChuckBase):
         conservative default of 2000us is used since some hosts may
         not be able to achieve such timing.
     :type i2c_read_delay: float, optional
+    :param pipelined: When True, the register pointer for the next frame is
+        written right after each read so that reads no longer block for the
+        full ``i2c_read_delay``. Default is False.
+    :type pipelined: bool, optional
+    :param fast_init: When True, the accessory is initialized as soon as it
+        responds instead of after two fixed 100ms pauses. Default is False.
+    :type fast_init: bool, optional
+    :param history: The number of frames to keep in ``history``. Default is
+        0, no history.
+    :type history: int, optional
+    :param stats: When True, reads are timed and counted in ``stats``.
+        Default is False.
+    :type stats: bool, optional
+    :param reconnect: When True, a disconnected accessory does not make
+        reads raise `OSError` and is re-initialized with an exponential
+        backoff, see ``connected``. Default is False.
+    :type reconnect: bool, optional
+    :param high_resolution: When True, the controller is switched to its 8
+        byte data format with 8 bit joysticks and triggers, if it supports
+        it. See `high_resolution`. Default is False.
+    :type high_resolution: bool, optional
     """
 
+    BTN_A = 0x0010
+    BTN_B = 0x0040
+    BTN_X = 0x0008
+    BTN_Y = 0x0020
+    BTN_R = 0x0200
+    BTN_L = 0x2000
+    BTN_ZR = 0x0004
+    BTN_ZL = 0x0080
+    BTN_START = 0x0400
+    BTN_SELECT = 0x1000
+    BTN_HOME = 0x0800
+    BTN_PLUS = 0x0400
+    BTN_MINUS = 0x1000
+    BTN_UP = 0x0001
+    BTN_DOWN = 0x4000
+    BTN_RIGHT = 0x8000
+    BTN_LEFT = 0x0002
+
     _Values = namedtuple("Values", ("joysticks", "buttons", "dpad", "triggers"))
     _Joysticks = namedtuple("Joysticks", ("rx", "ry", "lx", "ly"))
     _Buttons = namedtuple(
@@ -72,104 +144,202 @@ class ClassicController(WiiChuckBase):
     _Dpad = namedtuple("Dpad", ("up", "down", "right", "left"))
     _Triggers = namedtuple("Trigers", ("right", "left"))
 
-    def __init__(self, i2c, address=0x52, i2c_read_delay=0.002):
-        super().__init__(i2c, address=address, i2c_read_delay=i2c_read_delay)
+    _LAYOUT = Layout(
+        Group(
+            _Values,
+            Group(
+                _Joysticks,
+                Field((0, 0xC0, 3), (1, 0xC0, 5), (2, 0x80, 7)),  # rx
+                Field((2, 0x1F, 0)),  # ry
+                Field((0, 0x3F, 0)),  # lx
+                Field((1, 0x3F, 0)),  # ly
+            ),
+            Group(
+                _Buttons,
+                Button(5, 0x10),  # A
+                Button(5, 0x40),  # B
+                Button(5, 0x08),  # X
+                Button(5, 0x20),  # Y
+                Button(4, 0x02),  # R
+                Button(4, 0x20),  # L
+                Button(5, 0x04),  # ZR
+                Button(5, 0x80),  # ZL
+                Button(4, 0x04),  # start
+                Button(4, 0x10),  # select
+                Button(4, 0x08),  # home
+                Button(4, 0x04),  # plus
+                Button(4, 0x10),  # minus
+            ),
+            Group(
+                _Dpad,
+                Button(5, 0x01),  # up
+                Button(4, 0x40),  # down
+                Button(4, 0x80),  # right
+                Button(5, 0x02),  # left
+                prefix="dpad_",
+            ),
+            Group(
+                _Triggers,
+                Field((3, 0x1F, 0)),  # right
+                Field((2, 0x60, 2), (3, 0xE0, 5)),  # left
+                prefix="trigger_",
+            ),
+        )
+    )
+    _BUTTONS_MASK = _LAYOUT.buttons_mask
+    _BUTTONS_INVERT = _LAYOUT.buttons_invert
+    # data format 3: every value in its own byte and the buttons in bytes 6 and 7
+    _HIGH_RESOLUTION_LAYOUT = Layout(
+        Group(
+            _Values,
+            Group(
+                _Joysticks,
+                Field((1, 0xFF, 0)),  # rx
+                Field((3, 0xFF, 0)),  # ry
+                Field((0, 0xFF, 0)),  # lx
+                Field((2, 0xFF, 0)),  # ly
+            ),
+            Group(
+                _Buttons,
+                Button(7, 0x10),  # A
+                Button(7, 0x40),  # B
+                Button(7, 0x08),  # X
+                Button(7, 0x20),  # Y
+                Button(6, 0x02),  # R
+                Button(6, 0x20),  # L
+                Button(7, 0x04),  # ZR
+                Button(7, 0x80),  # ZL
+                Button(6, 0x04),  # start
+                Button(6, 0x10),  # select
+                Button(6, 0x08),  # home
+                Button(6, 0x04),  # plus
+                Button(6, 0x10),  # minus
+            ),
+            Group(
+                _Dpad,
+                Button(7, 0x01),  # up
+                Button(6, 0x40),  # down
+                Button(6, 0x80),  # right
+                Button(7, 0x02),  # left
+                prefix="dpad_",
+            ),
+            Group(
+                _Triggers,
+                Field((5, 0xFF, 0)),  # right
+                Field((4, 0xFF, 0)),  # left
+                prefix="trigger_",
+            ),
+        ),
+        buttons_byte=6,
+    )
 
-    @property
-    def values(self):
-        """The current state of all values."""
-        self._read_data()
-        return self._Values(
-            self._joysticks(do_read=False),
-            self._buttons(do_read=False),
-            self._dpad(do_read=False),
-            self._triggers(do_read=False),
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        i2c,
+        address=0x52,
+        i2c_read_delay=0.002,
+        pipelined=False,
+        fast_init=False,
+        history=0,
+        stats=False,
+        reconnect=False,
+        high_resolution=False,
+    ):
+        self._high_resolution = high_resolution
+        self._high_resolution_active = False
+        super().__init__(
+            i2c,
+            address=address,
+            i2c_read_delay=i2c_read_delay,
+            pipelined=pipelined,
+            fast_init=fast_init,
+            history=history,
+            stats=stats,
+            reconnect=reconnect,
         )
+        self.state = ClassicControllerState(self._LAYOUT)
+
+    def _init_accessory(self, fast=False, timeout=_I2C_INIT_TIMEOUT):
+        super()._init_accessory(fast, timeout)
+        if self._high_resolution:
+            # the accessory is back in the default format after every init
+            self._set_high_resolution()
+
+    def _set_high_resolution(self):
+        """Switches to the high resolution data format, staying in the
+        default format with controllers that do not read the format back."""
+        # the accessory is in the default format until the format is read back
+        self._use_layout(False)
+        try:
+            with self.i2c_device as i2c_dev:
+                i2c_dev.write(bytes((0xFE, _HIGH_RESOLUTION_FORMAT)))
+        except OSError:
+            # controllers without the register may not acknowledge the write
+            return
+        buffer = bytearray(1)
+        for attempt in range(_FORMAT_READ_ATTEMPTS):
+            try:
+                self._read_register(b"\xFE", buffer)
+                break
+            except OSError:
+                # the format may have changed, frames cannot be decoded without it
+                if attempt == _FORMAT_READ_ATTEMPTS - 1:
+                    raise
+        self._use_layout(buffer[0] == _HIGH_RESOLUTION_FORMAT)
+
+    def _use_layout(self, high_resolution):
+        # pylint: disable=invalid-name
+        self._high_resolution_active = high_resolution
+        layout = type(self)._LAYOUT
+        if high_resolution:
+            layout = self._HIGH_RESOLUTION_LAYOUT
+        self._LAYOUT = layout
+        self._BUTTONS_BYTE = layout.buttons_byte
+        self._BUTTONS_MASK = layout.buttons_mask
+        self._BUTTONS_INVERT = layout.buttons_invert
+        self._decoded_count = -1
+        self._state_count = -1
+
+    @property
+    def high_resolution(self):
+        """Whether the controller reports in the high resolution data format,
+        with joysticks and triggers from 0 to 255. False when created
+        without ``high_resolution=True`` or when the controller, like some
+        third party ones, does not support it."""
+        return self._high_resolution_active
 
     @property
     def joysticks(self):
-        """The current joysticks positions."""
-        return self._joysticks()
+        """The current joysticks positions, 0-255 in `high_resolution`."""
+        return self._value("joysticks")
 
     @property
     def buttons(self):
         """The current pressed state of all buttons."""
-        return self._buttons()
+        return self._value("buttons")
 
     @property
     def dpad(self):
         """The current pressed state of the dpad."""
-        return self._dpad()
+        return self._value("dpad")
 
     @property
     def triggers(self):
-        """The current readding from the triggers (0-31 for non-Pro) (0 or 31 Pro)."""
-        return self._triggers()
-
-    def _joysticks(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Joysticks(
-            (
-                (self.buffer[0] & 0xC0) >> 3
-                | (self.buffer[1] & 0xC0) >> 5
-                | (self.buffer[2] & 0x80) >> 7
-            ),  # rx
-            self.buffer[2] & 0x1F,  # ry
-            self.buffer[0] & 0x3F,  # lx
-            self.buffer[1] & 0x3F,  # ly
-        )
-
-    def _buttons(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Buttons(
-            not bool(self.buffer[5] & 0x10),  # A
-            not bool(self.buffer[5] & 0x40),  # B
-            not bool(self.buffer[5] & 0x8),  # X
-            not bool(self.buffer[5] & 0x20),  # Y
-            not bool(self.buffer[4] & 0x2),  # R
-            not bool(self.buffer[4] & 0x20),  # L
-            not bool(self.buffer[5] & 0x4),  # ZR
-            not bool(self.buffer[5] & 0x80),  # ZL
-            not bool(self.buffer[4] & 0x4),  # start
-            not bool(self.buffer[4] & 0x10),  # select
-            not bool(self.buffer[4] & 0x8),  # home
-            not bool(self.buffer[4] & 0x4),  # plus
-            not bool(self.buffer[4] & 0x10),  # minus
-        )
-
-    def _dpad(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Dpad(
-            not bool(self.buffer[5] & 0x1),  # UP
-            not bool(self.buffer[4] & 0x40),  # DOWN
-            not bool(self.buffer[4] & 0x80),  # RIGHT
-            not bool(self.buffer[5] & 0x2),  # LEFT
-        )
-
-    def _triggers(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Triggers(
-            self.buffer[3] & 0x1F,  # right
-            (self.buffer[2] & 0x60) >> 2 | (self.buffer[3] & 0xE0) >> 5,  # left
-        )
+        """The current readding from the triggers (0-31 for non-Pro) (0 or 31 Pro),
+        0-255 in `high_resolution`."""
+        return self._value("triggers")
 
-    def _read_data(self):
-        """Overides the ``_read_data()`` function.
+    def _process_data(self):
+        """Overides the ``_process_data()`` function.
 
         Checks to see if the data looks like it is comming from a thrid party remote
         and modifies it.
         """
 
-        super()._read_data()
-
-        if self._check_third_party():
+        if not self._high_resolution_active and self._check_third_party():
             self.buffer[4] = self.buffer[6]
             self.buffer[5] = self.buffer[7]
-        return self.buffer
+        return super()._process_data()
 
     def _check_third_party(self):
         """Checks if it is a thrid party controller.
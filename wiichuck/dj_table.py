@@ -26,12 +26,37 @@ Implementation Notes
 * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
 """
 from collections import namedtuple
-from wiichuck import WiiChuckBase
+from wiichuck import WiiChuckBase, WiiChuckState
+from wiichuck.layout import Button, Field, Group, Layout
 
 __version__ = "0.0.0-auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
 
 
+class DJTableState(WiiChuckState):  # pylint: disable=too-few-public-methods
+    """Mutable state of a `DJTable`, updated in place by `DJTable.update`."""
+
+    __slots__ = (
+        "joystick_x",
+        "joystick_y",
+        "euphoria",
+        "start",
+        "select",
+        "plus",
+        "minus",
+        "right_turntable",
+        "right_green",
+        "right_red",
+        "right_blue",
+        "left_turntable",
+        "left_green",
+        "left_red",
+        "left_blue",
+        "dial",
+        "slider",
+    )
+
+
 class DJTable(WiiChuckBase):
     """
     Class which provides interface to Nintendo Wii Classic Controller.
@@ -44,8 +69,37 @@ class DJTable(WiiChuckBase):
         conservative default of 2000us is used since some hosts may
         not be able to achieve such timing.
     :type i2c_read_delay: float, optional
+    :param pipelined: When True, the register pointer for the next frame is
+        written right after each read so that reads no longer block for the
+        full ``i2c_read_delay``. Default is False.
+    :type pipelined: bool, optional
+    :param fast_init: When True, the accessory is initialized as soon as it
+        responds instead of after two fixed 100ms pauses. Default is False.
+    :type fast_init: bool, optional
+    :param history: The number of frames to keep in ``history``. Default is
+        0, no history.
+    :type history: int, optional
+    :param stats: When True, reads are timed and counted in ``stats``.
+        Default is False.
+    :type stats: bool, optional
+    :param reconnect: When True, a disconnected accessory does not make
+        reads raise `OSError` and is re-initialized with an exponential
+        backoff, see ``connected``. Default is False.
+    :type reconnect: bool, optional
     """
 
+    BTN_EUPHORIA = 0x0010
+    BTN_START = 0x0400
+    BTN_SELECT = 0x1000
+    BTN_PLUS = 0x0400
+    BTN_MINUS = 0x1000
+    BTN_RIGHT_GREEN = 0x0020
+    BTN_RIGHT_RED = 0x0200
+    BTN_RIGHT_BLUE = 0x0004
+    BTN_LEFT_GREEN = 0x0008
+    BTN_LEFT_RED = 0x2000
+    BTN_LEFT_BLUE = 0x0080
+
     _Values = namedtuple(
         "Values", ("joystick", "buttons", "turntables", "dial", "slider")
     )
@@ -63,100 +117,96 @@ class DJTable(WiiChuckBase):
     _Turntables = namedtuple("Turntables", ("right", "left"))
     _Turntable = namedtuple("Turntable", ("value", "green", "red", "blue"))
 
-    def __init__(self, i2c, address=0x52, i2c_read_delay=0.002):
-        super().__init__(i2c, address=address, i2c_read_delay=i2c_read_delay)
-
-    @property
-    def values(self):
-        """The current state of all values."""
-        self._read_data()
-        return self._Values(
-            self._joystick(do_read=False),
-            self._buttons(do_read=False),
-            self._turntables(do_read=False),
-            self._dial(do_read=False),
-            self._slider(do_read=False),
+    _LAYOUT = Layout(
+        Group(
+            _Values,
+            Group(
+                _Joystick, Field((0, 0x3F, 0)), Field((1, 0x3F, 0)), prefix="joystick_"
+            ),
+            Group(
+                _Buttons,
+                Button(5, 0x10),  # euphoria
+                Button(4, 0x04),  # start
+                Button(4, 0x10),  # select
+                Button(4, 0x04),  # plus
+                Button(4, 0x10),  # minus
+            ),
+            Group(
+                _Turntables,
+                Group(
+                    _Turntable,
+                    Field(
+                        (0, 0xC0, 3),
+                        (1, 0xC0, 5),
+                        (2, 0x80, 7),
+                        sign=(2, 0x01),
+                        slot="right_turntable",
+                    ),
+                    Button(5, 0x20),  # green
+                    Button(4, 0x02),  # red
+                    Button(5, 0x04),  # blue
+                    prefix="right_",
+                ),
+                Group(
+                    _Turntable,
+                    Field((3, 0x1F, 0), sign=(4, 0x01), slot="left_turntable"),
+                    Button(5, 0x08),  # green
+                    Button(4, 0x20),  # red
+                    Button(5, 0x80),  # blue
+                    prefix="left_",
+                ),
+            ),
+            Field((2, 0x60, 2), (3, 0xE0, 5)),  # dial
+            Field((2, 0x1E, 1)),  # slider
+        )
+    )
+    _BUTTONS_MASK = _LAYOUT.buttons_mask
+    _BUTTONS_INVERT = _LAYOUT.buttons_invert
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        i2c,
+        address=0x52,
+        i2c_read_delay=0.002,
+        pipelined=False,
+        fast_init=False,
+        history=0,
+        stats=False,
+        reconnect=False,
+    ):
+        super().__init__(
+            i2c,
+            address=address,
+            i2c_read_delay=i2c_read_delay,
+            pipelined=pipelined,
+            fast_init=fast_init,
+            history=history,
+            stats=stats,
+            reconnect=reconnect,
         )
+        self.state = DJTableState(self._LAYOUT)
 
     @property
     def joystick(self):
         """The current joystick position."""
-        return self._joystick()
+        return self._value("joystick")
 
     @property
     def buttons(self):
         """The current pressed state of all buttons that are not on the turntable."""
-        return self._buttons()
+        return self._value("buttons")
 
     @property
     def turntables(self):
         """The current reading from the turntable and it's buttons."""
-        return self._turntables()
+        return self._value("turntables")
 
     @property
     def dial(self):
         """The current dial position."""
-        return self._dial()
+        return self._value("dial")
 
     @property
     def slider(self):
         """The current slider position."""
-        return self._slider()
-
-    def _joystick(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Joystick(
-            self.buffer[0] & 0x3F,
-            self.buffer[1] & 0x3F,
-        )
-
-    def _buttons(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Buttons(
-            not bool(self.buffer[5] & 0x10),  # euphoria
-            not bool(self.buffer[4] & 0x4),  # start
-            not bool(self.buffer[4] & 0x10),  # select
-            not bool(self.buffer[4] & 0x4),  # plus
-            not bool(self.buffer[4] & 0x10),  # minus
-        )
-
-    def _turntables(self, do_read=True):
-        if do_read:
-            self._read_data()
-
-        rtt = (self.buffer[0] & 0xC0) >> 3
-        rtt |= (self.buffer[1] & 0xC0) >> 5
-        rtt |= (self.buffer[2] & 0x80) >> 7
-        if self.buffer[2] & 0x1:
-            rtt = rtt * -1
-
-        ltt = self.buffer[3] & 0x1F
-        if self.buffer[4] & 0x1:
-            ltt = ltt * -1
-
-        return self._Turntables(
-            self._Turntable(
-                rtt,
-                not bool(self.buffer[5] & 0x20),  # green
-                not bool(self.buffer[4] & 0x2),  # red
-                not bool(self.buffer[5] & 0x4),  # blue
-            ),
-            self._Turntable(
-                ltt,
-                not bool(self.buffer[5] & 0x8),  # green
-                not bool(self.buffer[4] & 0x20),  # red
-                not bool(self.buffer[5] & 0x80),  # blue
-            ),
-        )
-
-    def _dial(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return ((self.buffer[2] & 0x60) >> 2) | ((self.buffer[3] & 0xE0) >> 5)
-
-    def _slider(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return (self.buffer[2] & 0x1E) >> 1
+        return self._value("slider")
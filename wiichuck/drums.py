@@ -45,12 +45,30 @@ Bass
 See http://wiibrew.org/wiki/Wiimote/Extension_Controllers/Guitar_Hero_World_Tour_(Wii)_Drums
 """
 from collections import namedtuple
-from wiichuck import WiiChuckBase
+from wiichuck import WiiChuckBase, WiiChuckState
+from wiichuck.layout import Button, Field, Group, Layout
 
 __version__ = "0.0.0-auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
 
 
+class DrumsState(WiiChuckState):  # pylint: disable=too-few-public-methods
+    """Mutable state of a `Drums`, updated in place by `Drums.update`."""
+
+    __slots__ = (
+        "joystick_x",
+        "joystick_y",
+        "orange",
+        "red",
+        "yellow",
+        "green",
+        "blue",
+        "bass",
+        "plus",
+        "minus",
+    )
+
+
 class Drums(WiiChuckBase):
     """
     Class which provides interface to Nintendo Wii Guitar Hero World Tour (Wii) Drums.
@@ -63,8 +81,34 @@ class Drums(WiiChuckBase):
         conservative default of 2000us is used since some hosts may
         not be able to achieve such timing.
     :type i2c_read_delay: float, optional
+    :param pipelined: When True, the register pointer for the next frame is
+        written right after each read so that reads no longer block for the
+        full ``i2c_read_delay``. Default is False.
+    :type pipelined: bool, optional
+    :param fast_init: When True, the accessory is initialized as soon as it
+        responds instead of after two fixed 100ms pauses. Default is False.
+    :type fast_init: bool, optional
+    :param history: The number of frames to keep in ``history``. Default is
+        0, no history.
+    :type history: int, optional
+    :param stats: When True, reads are timed and counted in ``stats``.
+        Default is False.
+    :type stats: bool, optional
+    :param reconnect: When True, a disconnected accessory does not make
+        reads raise `OSError` and is re-initialized with an exponential
+        backoff, see ``connected``. Default is False.
+    :type reconnect: bool, optional
     """
 
+    BTN_ORANGE = 0x0080
+    BTN_RED = 0x0040
+    BTN_YELLOW = 0x0020
+    BTN_GREEN = 0x0010
+    BTN_BLUE = 0x0008
+    BTN_BASS = 0x0004
+    BTN_PLUS = 0x0400
+    BTN_MINUS = 0x1000
+
     _Values = namedtuple("Values", ("joystick", "buttons"))
     _Joystick = namedtuple("Joysticks", ("x", "y"))
     _Buttons = namedtuple(
@@ -81,46 +125,57 @@ class Drums(WiiChuckBase):
         ),
     )
 
-    def __init__(self, i2c, address=0x52, i2c_read_delay=0.002):
-        super().__init__(i2c, address=address, i2c_read_delay=i2c_read_delay)
-
-    @property
-    def values(self):
-        """The current state of all values."""
-        self._read_data()
-        return self._Values(
-            self._joystick(do_read=False),
-            self._buttons(do_read=False),
+    _LAYOUT = Layout(
+        Group(
+            _Values,
+            Group(
+                _Joystick, Field((0, 0x3F, 0)), Field((1, 0x3F, 0)), prefix="joystick_"
+            ),
+            Group(
+                _Buttons,
+                Button(5, 0x80),  # orange (right cymbals)
+                Button(5, 0x40),  # red
+                Button(5, 0x20),  # yellow (left cymbals)
+                Button(5, 0x10),  # green
+                Button(5, 0x08),  # blue
+                Button(5, 0x04),  # bass
+                Button(4, 0x04),  # plus
+                Button(4, 0x10),  # minus
+            ),
         )
+    )
+    _BUTTONS_MASK = _LAYOUT.buttons_mask
+    _BUTTONS_INVERT = _LAYOUT.buttons_invert
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        i2c,
+        address=0x52,
+        i2c_read_delay=0.002,
+        pipelined=False,
+        fast_init=False,
+        history=0,
+        stats=False,
+        reconnect=False,
+    ):
+        super().__init__(
+            i2c,
+            address=address,
+            i2c_read_delay=i2c_read_delay,
+            pipelined=pipelined,
+            fast_init=fast_init,
+            history=history,
+            stats=stats,
+            reconnect=reconnect,
+        )
+        self.state = DrumsState(self._LAYOUT)
 
     @property
     def joystick(self):
         """The current joystick position."""
-        return self._joystick()
+        return self._value("joystick")
 
     @property
     def buttons(self):
         """The current pressed state of all buttons."""
-        return self._buttons()
-
-    def _joystick(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Joystick(
-            self.buffer[0] & 0x3F,
-            self.buffer[1] & 0x3F,
-        )
-
-    def _buttons(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Buttons(
-            not bool(self.buffer[5] & 0x80),  # orange (right cymbals)
-            not bool(self.buffer[5] & 0x40),  # red
-            not bool(self.buffer[5] & 0x20),  # yellow (left cymbals)
-            not bool(self.buffer[5] & 0x10),  # green
-            not bool(self.buffer[5] & 0x8),  # blue
-            not bool(self.buffer[5] & 0x4),  # bass
-            not bool(self.buffer[4] & 0x4),  # plus
-            not bool(self.buffer[4] & 0x10),  # minus
-        )
+        return self._value("buttons")
@@ -26,12 +26,35 @@ Implementation Notes
 * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
 """
 from collections import namedtuple
-from wiichuck import WiiChuckBase
+from wiichuck import WiiChuckBase, WiiChuckState
+from wiichuck.layout import Button, Field, Group, Layout
 
 __version__ = "0.0.0-auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
 
 
+class GuitarState(WiiChuckState):  # pylint: disable=too-few-public-methods
+    """Mutable state of a `Guitar`, updated in place by `Guitar.update`."""
+
+    __slots__ = (
+        "joystick_x",
+        "joystick_y",
+        "orange",
+        "blue",
+        "yellow",
+        "red",
+        "green",
+        "start",
+        "select",
+        "plus",
+        "minus",
+        "strum_up",
+        "strum_down",
+        "whammy",
+        "touchbar",
+    )
+
+
 class Guitar(WiiChuckBase):
     """
     Class which provides interface to Nintendo Wii Classic Controller.
@@ -44,8 +67,37 @@ class Guitar(WiiChuckBase):
         conservative default of 2000us is used since some hosts may
         not be able to achieve such timing.
     :type i2c_read_delay: float, optional
+    :param pipelined: When True, the register pointer for the next frame is
+        written right after each read so that reads no longer block for the
+        full ``i2c_read_delay``. Default is False.
+    :type pipelined: bool, optional
+    :param fast_init: When True, the accessory is initialized as soon as it
+        responds instead of after two fixed 100ms pauses. Default is False.
+    :type fast_init: bool, optional
+    :param history: The number of frames to keep in ``history``. Default is
+        0, no history.
+    :type history: int, optional
+    :param stats: When True, reads are timed and counted in ``stats``.
+        Default is False.
+    :type stats: bool, optional
+    :param reconnect: When True, a disconnected accessory does not make
+        reads raise `OSError` and is re-initialized with an exponential
+        backoff, see ``connected``. Default is False.
+    :type reconnect: bool, optional
     """
 
+    BTN_ORANGE = 0x0080
+    BTN_BLUE = 0x0020
+    BTN_YELLOW = 0x0008
+    BTN_RED = 0x0040
+    BTN_GREEN = 0x0010
+    BTN_START = 0x0400
+    BTN_SELECT = 0x1000
+    BTN_PLUS = 0x0400
+    BTN_MINUS = 0x1000
+    BTN_STRUM_UP = 0x0001
+    BTN_STRUM_DOWN = 0x4000
+
     _Values = namedtuple(
         "Values", ("joystick", "buttons", "strum", "whammy", "touchbar")
     )
@@ -66,83 +118,76 @@ class Guitar(WiiChuckBase):
     )
     _Strum = namedtuple("Strum", ("up", "down"))
 
-    def __init__(self, i2c, address=0x52, i2c_read_delay=0.002):
-        super().__init__(i2c, address=address, i2c_read_delay=i2c_read_delay)
-
-    @property
-    def values(self):
-        """The current state of all values."""
-        self._read_data()
-        return self._Values(
-            self._joystick(do_read=False),
-            self._buttons(do_read=False),
-            self._strum(do_read=False),
-            self._whammy(do_read=False),
-            self._touchbar(do_read=False),
+    _LAYOUT = Layout(
+        Group(
+            _Values,
+            Group(
+                _Joystick, Field((0, 0x3F, 0)), Field((1, 0x3F, 0)), prefix="joystick_"
+            ),
+            Group(
+                _Buttons,
+                Button(5, 0x80),  # orange
+                Button(5, 0x20),  # blue
+                Button(5, 0x08),  # yellow
+                Button(5, 0x40),  # red
+                Button(5, 0x10),  # green
+                Button(4, 0x04),  # start
+                Button(4, 0x10),  # select
+                Button(4, 0x04),  # plus
+                Button(4, 0x10),  # minus
+            ),
+            Group(_Strum, Button(5, 0x01), Button(4, 0x40), prefix="strum_"),
+            Field((3, 0x1F, 0)),  # whammy
+            Field((2, 0x1F, 0)),  # touchbar
+        )
+    )
+    _BUTTONS_MASK = _LAYOUT.buttons_mask
+    _BUTTONS_INVERT = _LAYOUT.buttons_invert
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        i2c,
+        address=0x52,
+        i2c_read_delay=0.002,
+        pipelined=False,
+        fast_init=False,
+        history=0,
+        stats=False,
+        reconnect=False,
+    ):
+        super().__init__(
+            i2c,
+            address=address,
+            i2c_read_delay=i2c_read_delay,
+            pipelined=pipelined,
+            fast_init=fast_init,
+            history=history,
+            stats=stats,
+            reconnect=reconnect,
         )
+        self.state = GuitarState(self._LAYOUT)
 
     @property
     def joystick(self):
         """The current joystick position."""
-        return self._joystick()
+        return self._value("joystick")
 
     @property
     def buttons(self):
         """The current pressed state of all buttons."""
-        return self._buttons()
+        return self._value("buttons")
 
     @property
     def strum(self):
         """The current pressed state of strum.up and strum.down."""
-        return self._strum()
+        return self._value("strum")
 
     @property
     def whammy(self):
         """The current whammy position."""
-        return self._whammy()
+        return self._value("whammy")
 
     @property
     def touchbar(self):
         """The current touchbar position. Only available in the Guitar Hero World Tour Guitars"""
-        return self._touchbar()
-
-    def _joystick(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Joystick(
-            self.buffer[0] & 0x3F,
-            self.buffer[1] & 0x3F,
-        )
-
-    def _buttons(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Buttons(
-            not bool(self.buffer[5] & 0x80),  # orange
-            not bool(self.buffer[5] & 0x20),  # blue
-            not bool(self.buffer[5] & 0x8),  # yellow
-            not bool(self.buffer[5] & 0x40),  # red
-            not bool(self.buffer[5] & 0x10),  # green
-            not bool(self.buffer[4] & 0x4),  # start
-            not bool(self.buffer[4] & 0x10),  # select
-            not bool(self.buffer[4] & 0x4),  # plus
-            not bool(self.buffer[4] & 0x10),  # minus
-        )
-
-    def _strum(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Strum(
-            not bool(self.buffer[5] & 0x1),  # up
-            not bool(self.buffer[4] & 0x40),  # down
-        )
-
-    def _touchbar(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self.buffer[2] & 0x1F
-
-    def _whammy(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self.buffer[3] & 0x1F
+        return self._value("touchbar")
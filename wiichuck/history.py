@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`wiichuck.history`
+================================================================================
+
+Fixed-capacity history of the frames read from Nintento WiiMote I2C
+Accessory Devices.
+
+
+* Author(s): John Furcean
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+import time
+from array import array
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
+
+_TIMESTAMP_MASK = 0xFFFFFFFF
+
+
+class FrameHistory:
+    """
+    Ring buffer of the last ``capacity`` raw frames read by a device and
+    their timestamps, decoded only when they are looked at.
+
+    All the memory is allocated upfront: 8 bytes per frame plus a 4 byte
+    timestamp in microseconds. Timestamps wrap around every 71 minutes;
+    use `elapsed` to get the time between two samples.
+
+    Indexing works like a list, from 0 for the oldest sample to -1 for the
+    newest, and returns the device's decoded values.
+
+    :param device: The `wiichuck.WiiChuckBase` device the frames come from,
+        used to decode them.
+    :param int capacity: The number of frames to keep.
+    """
+
+    def __init__(self, device, capacity):
+        self.device = device
+        self.capacity = capacity
+        self._frames = bytearray(capacity * 8)
+        self._timestamps = array("I", [0] * capacity)
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        return self.device.decode_frame(self.frame(index))
+
+    def append(self, frame):
+        """Add a frame, timestamped now, replacing the oldest one when full."""
+        offset = self._next * 8
+        self._frames[offset : offset + 8] = frame
+        self._timestamps[self._next] = (time.monotonic_ns() // 1000) & _TIMESTAMP_MASK
+        self._next = (self._next + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def clear(self):
+        """Forget all the frames."""
+        self._next = 0
+        self._count = 0
+
+    def _slot(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("history index out of range")
+        return (self._next - self._count + index) % self.capacity
+
+    def frame(self, index):
+        """The raw frame at ``index``, as a view that the next frames overwrite."""
+        offset = self._slot(index) * 8
+        return memoryview(self._frames)[offset : offset + 8]
+
+    def timestamp(self, index):
+        """The timestamp in microseconds of the frame at ``index``."""
+        return self._timestamps[self._slot(index)]
+
+    def elapsed(self, start, end=-1):
+        """The time in microseconds from sample ``start`` to sample ``end``."""
+        return (self.timestamp(end) - self.timestamp(start)) & _TIMESTAMP_MASK
+
+    def window(self, count=None):
+        """Yield ``(timestamp, values)`` for the newest ``count`` samples,
+        oldest first, decoding each one as it is reached.
+
+        :param int count: The number of samples, all of them if None.
+        """
+        if count is None or count > self._count:
+            count = self._count
+        for index in range(self._count - count, self._count):
+            yield self.timestamp(index), self[index]
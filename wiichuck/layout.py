@@ -0,0 +1,325 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`wiichuck.layout`
+================================================================================
+
+Declarative description of the bits of an accessory frame, compiled once per
+device class into the decoders behind ``values``, the single value
+properties and ``update()``.
+
+A layout is a tree of `Group` objects, one per namedtuple returned by the
+device class, whose leaves are `Field` values and `Button` states:
+
+.. code-block:: python
+
+    _Joystick = namedtuple("Joystick", ("x", "y"))
+    _Values = namedtuple("Values", ("joystick", "whammy"))
+    _LAYOUT = Layout(
+        Group(
+            _Values,
+            Group(_Joystick, Field((0, 0x3F, 0)), Field((1, 0x3F, 0)), prefix="joystick_"),
+            Field((3, 0x1F, 0)),
+        )
+    )
+
+
+* Author(s): John Furcean
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
+
+try:
+    _EXEC = callable(exec)
+except NameError:  # ports built without the compiler
+    _EXEC = False
+
+
+class Field:  # pylint: disable=too-few-public-methods
+    """
+    An integer assembled from bit ranges of the frame.
+
+    :param parts: ``(byte, mask, shift)`` tuples, each one contributing
+        ``(frame[byte] & mask) >> shift``; a negative ``shift`` shifts
+        left instead. The parts are OR'ed together.
+    :param sign: An optional ``(byte, mask)`` sign bit, the value is
+        negated when it is set.
+    :param str slot: The `WiiChuckState` field updated with this value,
+        by default the group ``prefix`` followed by the field name.
+    """
+
+    def __init__(self, *parts, sign=None, slot=None):
+        self.parts = parts
+        self.sign = sign
+        self.slot = slot
+
+
+class Button:  # pylint: disable=too-few-public-methods
+    """
+    A button, pressed when the bit ``mask`` of ``frame[byte]`` is clear.
+
+    :param bool active_low: False for the rare buttons that are pressed when
+        the bit is set. Default is True.
+    :param str slot: See `Field`.
+    """
+
+    def __init__(self, byte, mask, active_low=True, slot=None):
+        self.byte = byte
+        self.mask = mask
+        self.active_low = active_low
+        self.slot = slot
+
+
+class Group:  # pylint: disable=too-few-public-methods
+    """
+    A namedtuple of values.
+
+    :param tuple_class: The namedtuple class.
+    :param members: One `Field`, `Button` or `Group` per namedtuple field,
+        in the same order.
+    :param str prefix: Prepended to the member names to name their
+        `WiiChuckState` fields. Default is no prefix.
+    """
+
+    def __init__(self, tuple_class, *members, prefix=""):
+        if len(members) != len(tuple_class._fields):
+            raise ValueError(
+                "{} needs {} members".format(
+                    tuple_class.__name__, len(tuple_class._fields)
+                )
+            )
+        self.tuple_class = tuple_class
+        self.members = members
+        self.prefix = prefix
+
+
+def _part_source(part):
+    byte, mask, shift = part
+    source = "b[{}]".format(byte)
+    if mask != 0xFF:
+        source = "{} & 0x{:02X}".format(source, mask)
+    if shift > 0:
+        source = "({}) >> {}".format(source, shift)
+    elif shift < 0:
+        source = "({}) << {}".format(source, -shift)
+    return source
+
+
+def _leaf_source(member, target):
+    """The lines that decode the `Field` or `Button` ``member`` into ``target``."""
+    if isinstance(member, Button):
+        if member.active_low:
+            return [
+                "{} = not b[{}] & 0x{:02X}".format(target, member.byte, member.mask)
+            ]
+        return ["{} = bool(b[{}] & 0x{:02X})".format(target, member.byte, member.mask)]
+    source = " | ".join(_part_source(part) for part in member.parts)
+    if member.sign is None:
+        return ["{} = {}".format(target, source)]
+    return [
+        "t = " + source,
+        "{} = -t if b[{}] & 0x{:02X} else t".format(target, *member.sign),
+    ]
+
+
+class _Compiler:
+    """Generates the source of the decoder functions, which is compiled once
+    so that decoding runs as straight-line code like a hand-written decoder."""
+
+    def __init__(self):
+        self.lines = []
+        self.namespace = {}
+
+    def function(self, name, arguments, body):
+        """Add a function ``name`` made of the lines of ``body``."""
+        self.lines.append("def {}({}):".format(name, arguments))
+        self.lines.extend("    " + line for line in body)
+
+    def tuple_source(self, member, body):
+        """Add the lines computing ``member`` to ``body`` and return the
+        expression of its value."""
+        if not isinstance(member, Group):
+            target = "v{}".format(len(body))
+            body.extend(_leaf_source(member, target))
+            return target
+        name = "T{}".format(len(self.namespace))
+        self.namespace[name] = member.tuple_class
+        return "{}({})".format(
+            name,
+            ", ".join(self.tuple_source(child, body) for child in member.members),
+        )
+
+    def decoder(self, name, member):
+        """Add a function ``name`` of a frame returning the value of ``member``."""
+        body = []
+        body.append("return " + self.tuple_source(member, body))
+        self.function(name, "b", body)
+
+    def compile(self):
+        """Compile the functions and return the namespace holding them."""
+        exec("\n".join(self.lines), self.namespace)  # pylint: disable=exec-used
+        return self.namespace
+
+
+def _leaf_function(member):
+    """The function of a frame returning the value of the `Field` or `Button`
+    ``member``, without compiling any source."""
+    if isinstance(member, Button):
+        byte, mask = member.byte, member.mask
+        if member.active_low:
+            return lambda b: not b[byte] & mask
+        return lambda b: bool(b[byte] & mask)
+    parts, sign = member.parts, member.sign
+
+    def value(b):
+        result = 0
+        for byte, mask, shift in parts:
+            part = b[byte] & mask
+            result |= part >> shift if shift >= 0 else part << -shift
+        if sign is not None and b[sign[0]] & sign[1]:
+            return -result
+        return result
+
+    return value
+
+
+def _member_function(member):
+    """Like `_leaf_function` for any member, `Group` included."""
+    if not isinstance(member, Group):
+        return _leaf_function(member)
+    tuple_class = member.tuple_class
+    functions = tuple(_member_function(child) for child in member.members)
+    return lambda b: tuple_class(*[function(b) for function in functions])
+
+
+def _update_function(leaves):
+    """The ``update`` function of ``(slot, member)`` leaves, without compiling
+    any source."""
+    slots = tuple((slot, _leaf_function(member)) for slot, member in leaves)
+
+    def update(state, frame):
+        for slot, function in slots:
+            setattr(state, slot, function(frame))
+        return state
+
+    return update
+
+
+def _leaves(group, path=""):
+    """Yield ``(path, slot, member)`` for every `Field` and `Button` of ``group``."""
+    for name, member in zip(group.tuple_class._fields, group.members):
+        if isinstance(member, Group):
+            for leaf in _leaves(member, path + name + "."):
+                yield leaf
+        else:
+            yield path + name, member.slot or group.prefix + name, member
+
+
+class Layout:
+    """
+    The compiled decoders of a frame layout.
+
+    :param Group values: The group describing the ``values`` namedtuple.
+    :param int buttons_byte: The index of the first of the two button bytes
+        that ``buttons_mask`` is made of. Default is 4.
+
+    The decoders are compiled from generated source where ``exec`` is
+    available, and made of closures over the layout otherwise, which is
+    slower but needs no compiler.
+    """
+
+    def __init__(self, values, buttons_byte=4):
+        # buttons_mask bits, see WiiChuckBase
+        self.buttons_byte = buttons_byte
+        self.buttons_mask = 0
+        self.buttons_invert = 0
+        leaves = []
+        self._defaults = []
+        for _, slot, member in _leaves(values):
+            leaves.append((slot, member))
+            self._defaults.append((slot, False if isinstance(member, Button) else 0))
+            if isinstance(member, Button) and member.byte in (
+                buttons_byte,
+                buttons_byte + 1,
+            ):
+                bit = member.mask << 8 * (buttons_byte + 1 - member.byte)
+                self.buttons_mask |= bit
+                if member.active_low:
+                    self.buttons_invert |= bit
+        # the (slot, member) of every Field and Button, in update() order
+        self.leaves = tuple(leaves)
+        self._values = values
+        self._selectors = {}
+        names = values.tuple_class._fields
+        # the decoder of each member of values, behind the single value properties
+        self.decoders = {}
+        if not _EXEC:
+            self.decode = _member_function(values)
+            for name, member in zip(names, values.members):
+                self.decoders[name] = _member_function(member)
+            self.update = _update_function(leaves)
+            return
+        compiler = _Compiler()
+        compiler.decoder("decode", values)
+        for index, member in enumerate(values.members):
+            compiler.decoder("decode_{}".format(index), member)
+        body = []
+        for slot, member in leaves:
+            body.extend(_leaf_source(member, "s." + slot))
+        body.append("return s")
+        compiler.function("update", "s, b", body)
+        namespace = compiler.compile()
+        self.decode = namespace["decode"]
+        for index, name in enumerate(names):
+            self.decoders[name] = namespace["decode_{}".format(index)]
+        self.update = namespace["update"]
+
+    def reset(self, state):
+        """Set the buttons of ``state`` to False and its values to 0."""
+        for slot, value in self._defaults:
+            setattr(state, slot, value)
+        return state
+
+    def _member(self, path):
+        member = self._values
+        for name in path.split("."):
+            if not isinstance(member, Group) or name not in member.tuple_class._fields:
+                raise ValueError("Unknown field {}".format(path))
+            member = member.members[member.tuple_class._fields.index(name)]
+        return member
+
+    def selector(self, paths):
+        """Compile a decoder of only the given fields.
+
+        :param paths: A sequence of dotted paths into ``values``, such as
+            ``("joysticks.lx", "buttons.A", "dpad")``.
+        :return: A function of a frame returning a tuple of the values, in
+            the order of ``paths``.
+        """
+        paths = tuple(paths)
+        if paths not in self._selectors and not _EXEC:
+            functions = tuple(_member_function(self._member(path)) for path in paths)
+            self._selectors[paths] = lambda b: tuple(
+                function(b) for function in functions
+            )
+        if paths not in self._selectors:
+            compiler = _Compiler()
+            body = []
+            sources = [
+                compiler.tuple_source(self._member(path), body) for path in paths
+            ]
+            body.append("return ({},)".format(", ".join(sources)))
+            compiler.function("select", "b", body)
+            self._selectors[paths] = compiler.compile()["select"]
+        return self._selectors[paths]
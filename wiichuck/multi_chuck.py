@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`wiichuck.multi_chuck`
+================================================================================
+
+Round-robin polling of several Nintento WiiMote I2C Accessory Devices behind
+a TCA9548A style I2C multiplexer. Every accessory uses the same 0x52
+address, so each one needs its own multiplexer channel.
+
+
+* Author(s): John Furcean
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Adafruit TCA9548A 1-to-8 I2C Multiplexer Breakout <https://www.adafruit.com/product/2717>`_
+* `Adafruit Wii Nunchuck Breakout Adapter <https://www.adafruit.com/product/4836>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+* Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+* Adafruit's TCA9548A library: https://github.com/adafruit/Adafruit_CircuitPython_TCA9548A
+"""
+import time
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
+
+
+class MultiChuck:
+    """
+    Polls accessories on several multiplexer channels, overlapping their
+    read delays.
+
+    Each `poll` first writes the register pointer of every channel and only
+    then reads them back in the same order, so the accessories wait out
+    their ``i2c_read_delay`` at the same time instead of one after another.
+
+    .. code-block:: python
+
+        mux = adafruit_tca9548a.TCA9548A(board.I2C())
+        players = MultiChuck(mux, ((0, Nunchuk), (1, Nunchuk), (2, ClassicController)))
+        while True:
+            for values in players.poll():
+                print(values)
+
+    :param mux: The multiplexer, indexed by channel number to get the
+        `busio.I2C` compatible object for that channel.
+    :param channels: A sequence of ``(channel, device_class)`` pairs.
+    :param kwargs: Passed on to every device class, such as
+        ``i2c_read_delay`` or ``fast_init``.
+    """
+
+    def __init__(self, mux, channels, **kwargs):
+        self.channels = tuple(channel for channel, _ in channels)
+        self.devices = tuple(
+            device_class(mux[channel], **kwargs) for channel, device_class in channels
+        )
+        self.states = [None] * len(self.devices)
+        self.errors = [0] * len(self.devices)
+        self._polls = 0
+        self._start = None
+
+    @property
+    def rate(self):
+        """The total number of accessory reads per second since the first `poll`."""
+        if self._start is None:
+            return 0
+        elapsed = time.monotonic_ns() - self._start
+        return self._polls * 1e9 / elapsed if elapsed else 0
+
+    def state(self, channel):
+        """The latest values read from the accessory on ``channel``."""
+        return self.states[self.channels.index(channel)]
+
+    def poll(self):
+        """Read every accessory once.
+
+        Accessories that fail with an `OSError` keep their previous values
+        and have their ``errors`` count incremented.
+
+        :return: The ``states`` list, in the same order as ``channels``.
+        """
+        if self._start is None:
+            self._start = time.monotonic_ns()
+        started = [False] * len(self.devices)
+        for index, device in enumerate(self.devices):
+            try:
+                device.begin_read()
+                started[index] = True
+            except OSError:
+                self.errors[index] += 1
+        for index, device in enumerate(self.devices):
+            if not started[index]:
+                continue
+            try:
+                device.finish_read()
+            except OSError:
+                self.errors[index] += 1
+                continue
+            self.states[index] = device.decode()
+            self._polls += 1
+        return self.states
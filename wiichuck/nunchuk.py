@@ -28,12 +28,27 @@ Implementation Notes
 * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
 """
 from collections import namedtuple
-from wiichuck import WiiChuckBase
+from wiichuck import WiiChuckBase, WiiChuckState
+from wiichuck.layout import Button, Field, Group, Layout
 
 __version__ = "0.0.0-auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
 
 
+class NunchukState(WiiChuckState):  # pylint: disable=too-few-public-methods
+    """Mutable state of a `Nunchuk`, updated in place by `Nunchuk.update`."""
+
+    __slots__ = (
+        "joystick_x",
+        "joystick_y",
+        "C",
+        "Z",
+        "acceleration_x",
+        "acceleration_y",
+        "acceleration_z",
+    )
+
+
 class Nunchuk(WiiChuckBase):
     """
     Class which provides interface to Nintendo Nunchuk controller.
@@ -46,58 +61,86 @@ class Nunchuk(WiiChuckBase):
         conservative default of 2000us is used since some hosts may
         not be able to achieve such timing.
     :type i2c_read_delay: float, optional
+    :param pipelined: When True, the register pointer for the next frame is
+        written right after each read so that reads no longer block for the
+        full ``i2c_read_delay``. Default is False.
+    :type pipelined: bool, optional
+    :param fast_init: When True, the accessory is initialized as soon as it
+        responds instead of after two fixed 100ms pauses. Default is False.
+    :type fast_init: bool, optional
+    :param history: The number of frames to keep in ``history``. Default is
+        0, no history.
+    :type history: int, optional
+    :param stats: When True, reads are timed and counted in ``stats``.
+        Default is False.
+    :type stats: bool, optional
+    :param reconnect: When True, a disconnected accessory does not make
+        reads raise `OSError` and is re-initialized with an exponential
+        backoff, see ``connected``. Default is False.
+    :type reconnect: bool, optional
     """
 
+    BTN_C = 0x0002
+    BTN_Z = 0x0001
+
     _Values = namedtuple("Values", ("joystick", "buttons", "acceleration"))
     _Joystick = namedtuple("Joystick", ("x", "y"))
     _Buttons = namedtuple("Buttons", ("C", "Z"))
     _Acceleration = namedtuple("Acceleration", ("x", "y", "z"))
 
-    def __init__(self, i2c, address=0x52, i2c_read_delay=0.002):
-        super().__init__(i2c, address=address, i2c_read_delay=i2c_read_delay)
-
-    @property
-    def values(self):
-        """The current state of all values."""
-        self._read_data()
-        return self._Values(
-            self._joystick(do_read=False),
-            self._buttons(do_read=False),
-            self._acceleration(do_read=False),
+    _LAYOUT = Layout(
+        Group(
+            _Values,
+            Group(
+                _Joystick, Field((0, 0xFF, 0)), Field((1, 0xFF, 0)), prefix="joystick_"
+            ),
+            Group(_Buttons, Button(5, 0x02), Button(5, 0x01)),
+            Group(
+                _Acceleration,
+                Field((5, 0xC0, 6), (2, 0xFF, -2)),
+                Field((5, 0x30, 4), (3, 0xFF, -2)),
+                Field((5, 0x0C, 2), (4, 0xFF, -2)),
+                prefix="acceleration_",
+            ),
+        )
+    )
+    _BUTTONS_MASK = _LAYOUT.buttons_mask
+    _BUTTONS_INVERT = _LAYOUT.buttons_invert
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        i2c,
+        address=0x52,
+        i2c_read_delay=0.002,
+        pipelined=False,
+        fast_init=False,
+        history=0,
+        stats=False,
+        reconnect=False,
+    ):
+        super().__init__(
+            i2c,
+            address=address,
+            i2c_read_delay=i2c_read_delay,
+            pipelined=pipelined,
+            fast_init=fast_init,
+            history=history,
+            stats=stats,
+            reconnect=reconnect,
         )
+        self.state = NunchukState(self._LAYOUT)
 
     @property
     def joystick(self):
         """The current joystick position."""
-        return self._joystick()
+        return self._value("joystick")
 
     @property
     def buttons(self):
         """The current pressed state of all buttons."""
-        return self._buttons()
+        return self._value("buttons")
 
     @property
     def acceleration(self):
         """The current accelerometer reading."""
-        return self._acceleration()
-
-    def _joystick(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Joystick(self.buffer[0], self.buffer[1])  # x, y
-
-    def _buttons(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Buttons(
-            not bool(self.buffer[5] & 0x02), not bool(self.buffer[5] & 0x01)  # C  # Z
-        )
-
-    def _acceleration(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Acceleration(
-            ((self.buffer[5] & 0xC0) >> 6) | (self.buffer[2] << 2),  # ax
-            ((self.buffer[5] & 0x30) >> 4) | (self.buffer[3] << 2),  # ay
-            ((self.buffer[5] & 0x0C) >> 2) | (self.buffer[4] << 2),  # az
-        )
+        return self._value("acceleration")
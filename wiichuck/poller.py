@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`wiichuck.poller`
+================================================================================
+
+Background and parallel polling of Nintento WiiMote I2C Accessory Devices on
+Linux/Blinka hosts. Requires the ``threading`` and ``concurrent.futures``
+modules, which are not available in CircuitPython.
+
+
+* Author(s): John Furcean
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit Blinka: https://github.com/adafruit/Adafruit_Blinka
+* Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+"""
+import time
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
+
+
+class Poller:
+    """
+    Polls a device at a fixed rate from a background thread.
+
+    Every decoded frame is published as one ``(sequence, timestamp_ns,
+    values)`` snapshot, replaced with a single reference assignment, so
+    `latest` never waits on the polling thread.
+
+    :param device: The `wiichuck.WiiChuckBase` device to poll.
+    :param float rate_hz: The number of polls per second. The device is
+        polled as often as possible if it cannot keep up.
+    """
+
+    _Sample = namedtuple("Sample", ("sequence", "values", "age"))
+
+    def __init__(self, device, rate_hz=500):
+        self.device = device
+        self._period = int(1e9 / rate_hz)
+        self._snapshot = (0, None, None)
+        self._errors = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.stop()
+
+    @property
+    def running(self):
+        """Whether the polling thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def errors(self):
+        """The number of polls that failed with an `OSError`."""
+        return self._errors
+
+    def start(self):
+        """Start polling in a background thread."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Stop polling and wait for the thread to exit.
+
+        :param float timeout: The longest time in seconds to wait for the
+            thread, forever if None.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def latest(self):
+        """The latest sample, without blocking.
+
+        :return: A ``(sequence, values, age)`` tuple where ``sequence`` counts
+            the polls, ``values`` are the device's decoded values and ``age``
+            is the time in seconds since they were read. ``values`` and
+            ``age`` are None until the first poll completes.
+        """
+        sequence, timestamp, values = self._snapshot
+        if timestamp is None:
+            return self._Sample(sequence, None, None)
+        return self._Sample(sequence, values, (time.monotonic_ns() - timestamp) / 1e9)
+
+    def _run(self):
+        device = self.device
+        sequence = 0
+        next_poll = time.monotonic_ns()
+        while not self._stop.is_set():
+            try:
+                values = device.values
+            except OSError:
+                self._errors += 1
+            else:
+                sequence += 1
+                self._snapshot = (sequence, time.monotonic_ns(), values)
+
+            next_poll += self._period
+            now = time.monotonic_ns()
+            if next_poll > now:
+                self._stop.wait((next_poll - now) / 1e9)
+            else:
+                # fell behind, restart the schedule from now
+                next_poll = now
+
+
+class MultiBusPoller:
+    """
+    Polls devices on several independent I2C buses in parallel, with one
+    worker thread per bus.
+
+    .. code-block:: python
+
+        buses = (
+            (Nunchuk(I2C(1)),),
+            (ClassicController(I2C(3)),),
+        )
+        with MultiBusPoller(buses) as poller:
+            while True:
+                timestamp, values = poller.poll()
+
+    Each worker writes the register pointer of every device on its bus
+    before reading them back, so their read delays overlap as well. The
+    devices on one bus therefore need distinct addresses; every Wii
+    accessory answers at 0x52, so several of them on one bus have to sit
+    on the channels of an I2C multiplexer, see `wiichuck.multi_chuck`.
+
+    :param buses: A sequence with, for each bus, the sequence of
+        `wiichuck.WiiChuckBase` devices on it.
+    """
+
+    _FrameSet = namedtuple("FrameSet", ("timestamp", "values"))
+
+    def __init__(self, buses):
+        self.buses = tuple(tuple(devices) for devices in buses)
+        self.errors = [[0] * len(devices) for devices in self.buses]
+        self._executor = ThreadPoolExecutor(max_workers=len(self.buses))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def close(self):
+        """Shut down the worker threads."""
+        self._executor.shutdown(wait=True)
+
+    def poll(self):
+        """Read every device on every bus once, one bus per worker thread.
+
+        :return: A ``(timestamp, values)`` frame set, where ``timestamp`` is
+            the `time.monotonic_ns` when the slowest bus finished and
+            ``values`` holds, for each bus, a tuple with the decoded values
+            of each device on it, None for devices that failed with an
+            `OSError`.
+        """
+        futures = [
+            self._executor.submit(self._poll_bus, index)
+            for index in range(len(self.buses))
+        ]
+        values = tuple(future.result() for future in futures)
+        return self._FrameSet(time.monotonic_ns(), values)
+
+    def _poll_bus(self, bus):
+        devices = self.buses[bus]
+        errors = self.errors[bus]
+        started = []
+        for index, device in enumerate(devices):
+            try:
+                device.begin_read()
+                started.append(True)
+            except OSError:
+                errors[index] += 1
+                started.append(False)
+        values = []
+        for index, device in enumerate(devices):
+            if started[index]:
+                try:
+                    device.finish_read()
+                    values.append(device.decode())
+                    continue
+                except OSError:
+                    errors[index] += 1
+            values.append(None)
+        return tuple(values)
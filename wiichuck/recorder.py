@@ -0,0 +1,333 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`wiichuck.recorder`
+================================================================================
+
+Recording of the raw frames read from Nintento WiiMote I2C Accessory Devices.
+
+A log starts with a header::
+
+    magic       4s  b"WCHK"
+    version     B   1
+    device type B   index in DEVICE_TYPES
+    device id   6s  the 6 byte extension controller identifier
+    read delay  I   i2c_read_delay in microseconds
+    flags       B   bit 0: pipelined reads, bit 1: high resolution data format
+
+followed by fixed-width little-endian records::
+
+    delta       I   nanoseconds since the previous record, saturated
+    device type B   index in DEVICE_TYPES
+    frame       8s  the raw frame
+
+Compressed logs start with the same header, with the b"WCHZ" magic, followed
+by variable-length records that each begin with a tag byte. A non-zero tag
+is a changed frame::
+
+    tag         B       bit n set when byte n of the frame changed
+    delta       varint  nanoseconds since the previous frame
+    bytes       ...     the new value of each changed byte, in order
+
+and a zero tag is a run of frames identical to the previous one::
+
+    tag         B       0
+    count       varint  number of repeated frames
+    duration    varint  nanoseconds covered by the whole run
+
+Varints are unsigned LEB128.
+
+
+* Author(s): John Furcean
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+* Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+"""
+import time
+import struct
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
+
+MAGIC = b"WCHK"
+COMPRESSED_MAGIC = b"WCHZ"
+VERSION = 1
+HEADER_FORMAT = "<4sBB6sIB"
+RECORD_FORMAT = "<IB8s"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+
+FLAG_PIPELINED = 0x01
+FLAG_HIGH_RESOLUTION = 0x02
+
+DEVICE_TYPES = (
+    "WiiChuckBase",
+    "Nunchuk",
+    "ClassicController",
+    "Guitar",
+    "Drums",
+    "DJTable",
+    "UDraw",
+)
+"""The device class names, indexed by the device type stored in logs."""
+
+_MAX_DELTA = 0xFFFFFFFF
+
+
+def device_type(device):
+    """The device type of ``device`` as stored in logs."""
+    for cls in type(device).__mro__:
+        if cls.__name__ in DEVICE_TYPES:
+            return DEVICE_TYPES.index(cls.__name__)
+    return 0
+
+
+class Recorder:
+    """
+    Appends every frame read by a device to a binary log.
+
+    Records are collected in a preallocated buffer and written ``batch`` at
+    a time, so recording does not write to the stream on every poll.
+
+    .. code-block:: python
+
+        nc = Nunchuk(board.I2C())
+        with open("/session.wchk", "wb") as log, Recorder(nc, log):
+            while True:
+                nc.values
+
+    :param device: The `wiichuck.WiiChuckBase` device to record.
+    :param stream: The binary stream, such as a file, to write the log to.
+    :param int batch: The number of records to buffer between writes.
+    """
+
+    _MAGIC = MAGIC
+
+    def __init__(self, device, stream, batch=64):
+        self.device = device
+        self.stream = stream
+        self._type = device_type(device)
+        self._buffer = bytearray(batch * RECORD_SIZE)
+        self._offset = 0
+        self._last = None
+        flags = FLAG_PIPELINED if device.pipelined else 0
+        if getattr(device, "high_resolution", False):
+            flags |= FLAG_HIGH_RESOLUTION
+        self.stream.write(
+            struct.pack(
+                HEADER_FORMAT,
+                self._MAGIC,
+                VERSION,
+                self._type,
+                device.device_id,
+                int(device.i2c_read_delay * 1e6),
+                flags,
+            )
+        )
+        device.add_frame_listener(self._record)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def _record(self, device):
+        now = time.monotonic_ns()
+        delta = 0 if self._last is None else min(now - self._last, _MAX_DELTA)
+        self._last = now
+        struct.pack_into(
+            RECORD_FORMAT, self._buffer, self._offset, delta, self._type, device.buffer
+        )
+        self._offset += RECORD_SIZE
+        if self._offset == len(self._buffer):
+            self.flush()
+
+    def flush(self):
+        """Write the buffered records to the stream."""
+        if self._offset:
+            self.stream.write(memoryview(self._buffer)[: self._offset])
+            self._offset = 0
+
+    def close(self):
+        """Stop recording and write the buffered records. Does not close the stream."""
+        self.device.remove_frame_listener(self._record)
+        self.flush()
+
+
+def _write_varint(buffer, offset, value):
+    while value > 0x7F:
+        buffer[offset] = (value & 0x7F) | 0x80
+        value >>= 7
+        offset += 1
+    buffer[offset] = value
+    return offset + 1
+
+
+class CompressedRecorder(Recorder):
+    """
+    Appends the frames read by a device to a compressed log that only stores
+    the bytes that changed, and run lengths for repeated frames, so that an
+    idle controller takes almost no space.
+
+    Used like `Recorder`. The log is written whenever ``batch`` bytes of
+    records are buffered. Read it back with `iter_log`.
+
+    :param device: The `wiichuck.WiiChuckBase` device to record.
+    :param stream: The binary stream, such as a file, to write the log to.
+    :param int batch: The number of bytes to buffer between writes.
+    """
+
+    _MAGIC = COMPRESSED_MAGIC
+
+    # the longest record: tag, 10 byte varint delta and 8 changed bytes
+    _MAX_RECORD_SIZE = 19
+
+    def __init__(self, device, stream, batch=512):
+        self._frame = None
+        self._run_count = 0
+        self._run_duration = 0
+        super().__init__(device, stream, batch=1)
+        self._buffer = bytearray(max(batch, self._MAX_RECORD_SIZE))
+
+    def _record(self, device):
+        now = time.monotonic_ns()
+        delta = 0 if self._last is None else now - self._last
+        self._last = now
+        frame = device.buffer
+        if self._frame is None:
+            self._frame = bytearray(8)
+            tag = 0xFF
+        else:
+            tag = 0
+            for index in range(8):
+                if frame[index] != self._frame[index]:
+                    tag |= 1 << index
+            if not tag:
+                self._run_count += 1
+                self._run_duration += delta
+                return
+        self._write_run()
+        self._reserve()
+        buffer = self._buffer
+        buffer[self._offset] = tag
+        offset = _write_varint(buffer, self._offset + 1, delta)
+        for index in range(8):
+            if tag & (1 << index):
+                buffer[offset] = self._frame[index] = frame[index]
+                offset += 1
+        self._offset = offset
+
+    def _write_run(self):
+        if not self._run_count:
+            return
+        self._reserve()
+        self._buffer[self._offset] = 0
+        offset = _write_varint(self._buffer, self._offset + 1, self._run_count)
+        self._offset = _write_varint(self._buffer, offset, self._run_duration)
+        self._run_count = 0
+        self._run_duration = 0
+
+    def _reserve(self):
+        if self._offset + self._MAX_RECORD_SIZE > len(self._buffer):
+            super().flush()
+
+    def flush(self):
+        """Write the buffered records, including any pending run, to the stream."""
+        self._write_run()
+        super().flush()
+
+
+def read_header(stream):
+    """Read the header of a log.
+
+    :return: A ``(compressed, device_type, device_id, i2c_read_delay, flags)``
+        tuple, with ``i2c_read_delay`` in seconds.
+    """
+    data = stream.read(HEADER_SIZE)
+    if len(data) != HEADER_SIZE:
+        raise ValueError("Not a wiichuck frame log")
+    magic, version, dev_type, dev_id, read_delay, flags = struct.unpack(
+        HEADER_FORMAT, data
+    )
+    if magic not in (MAGIC, COMPRESSED_MAGIC) or version != VERSION:
+        raise ValueError("Not a wiichuck frame log")
+    return magic == COMPRESSED_MAGIC, dev_type, dev_id, read_delay / 1e6, flags
+
+
+def _read_varint(stream):
+    value = 0
+    shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            raise ValueError("Truncated wiichuck frame log")
+        value |= (byte[0] & 0x7F) << shift
+        if not byte[0] & 0x80:
+            return value
+        shift += 7
+
+
+def iter_records(stream):
+    """Yield ``(count, duration, frame)`` for every record of a log,
+    compressed or not, without expanding runs.
+
+    ``count`` is the number of identical frames the record stands for, 1
+    for everything but runs, and ``duration`` the nanoseconds they cover.
+    The same ``frame`` bytearray is updated and yielded every time, copy it
+    to keep it.
+
+    :param stream: A binary stream positioned at the start of the log.
+    """
+    compressed = read_header(stream)[0]
+    frame = bytearray(8)
+    if not compressed:
+        record = bytearray(RECORD_SIZE)
+        while stream.readinto(record) == RECORD_SIZE:
+            frame[:] = record[5:]
+            yield 1, struct.unpack_from("<I", record)[0], frame
+        return
+    while True:
+        tag = stream.read(1)
+        if not tag:
+            return
+        tag = tag[0]
+        if tag:
+            delta = _read_varint(stream)
+            for index in range(8):
+                if tag & (1 << index):
+                    frame[index] = stream.read(1)[0]
+            yield 1, delta, frame
+        else:
+            count = _read_varint(stream)
+            yield count, _read_varint(stream), frame
+
+
+def run_delta(count, duration, index):
+    """The delta of frame ``index`` of a run of ``count`` frames covering
+    ``duration`` nanoseconds: the duration is spread evenly and the
+    remainder goes to the first frame."""
+    return duration // count + (duration % count if not index else 0)
+
+
+def iter_log(stream):
+    """Yield ``(delta, frame)`` for every frame of a log, compressed or not.
+
+    Frames are streamed from ``stream``, so runs of repeated frames are
+    expanded without loading the log into memory. ``delta`` is in
+    nanoseconds. The same ``frame`` bytearray is updated and yielded every
+    time, copy it to keep it.
+
+    :param stream: A binary stream positioned at the start of the log.
+    """
+    for count, duration, frame in iter_records(stream):
+        for index in range(count):
+            yield run_delta(count, duration, index), frame
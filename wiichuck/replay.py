@@ -0,0 +1,285 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`wiichuck.replay`
+================================================================================
+
+Replay of frame logs written by `wiichuck.recorder.Recorder` or
+`wiichuck.recorder.CompressedRecorder` through the regular device classes,
+without hardware. Logs are memory-mapped, or streamed when compressed, so
+frames are never all loaded into memory. Requires the ``mmap`` module, which
+is not available in CircuitPython.
+
+
+* Author(s): John Furcean
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit Blinka: https://github.com/adafruit/Adafruit_Blinka
+* Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+"""
+import time
+import mmap
+import struct
+from wiichuck.recorder import (
+    FLAG_HIGH_RESOLUTION,
+    HEADER_SIZE,
+    RECORD_SIZE,
+    DEVICE_TYPES,
+    iter_records,
+    read_header,
+    run_delta,
+)
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
+
+REALTIME = 0
+"""Frames are returned at the pace they were recorded at."""
+FAST = 1
+"""Frames are returned as fast as they are read."""
+STEP = 2
+"""The same frame is returned until `ReplayBus.step` or `ReplayBus.seek` is called."""
+
+_DELTA_FORMAT = "<I"
+_FRAME_OFFSET = 5
+_ID_REGISTER = 0xFA
+_FORMAT_REGISTER = 0xFE
+
+
+def device_class(device_type):
+    """The device class for a device type stored in a log."""
+    name = DEVICE_TYPES[device_type]
+    # pylint: disable=import-outside-toplevel
+    if name == "Nunchuk":
+        from wiichuck.nunchuk import Nunchuk as cls
+    elif name == "ClassicController":
+        from wiichuck.classic_controller import ClassicController as cls
+    elif name == "Guitar":
+        from wiichuck.guitar import Guitar as cls
+    elif name == "Drums":
+        from wiichuck.drums import Drums as cls
+    elif name == "DJTable":
+        from wiichuck.dj_table import DJTable as cls
+    elif name == "UDraw":
+        from wiichuck.udraw import UDraw as cls
+    else:
+        from wiichuck import WiiChuckBase as cls
+    return cls
+
+
+class ReplayBus:  # pylint: disable=too-many-instance-attributes
+    """
+    A `busio.I2C` stand-in that answers the accessory's register reads from
+    a recorded log, so that any device class can be built on top of it and
+    decodes the recorded frames through its usual ``buffer``.
+
+    .. code-block:: python
+
+        with ReplayBus("session.wchk") as bus:
+            nunchuk = bus.device()
+            for _ in range(bus.frame_count):
+                print(nunchuk.values)
+
+    Reading past the last frame raises `EOFError`.
+
+    :param str path: The log file to replay.
+    :param int mode: `REALTIME`, `FAST` or `STEP`.
+    """
+
+    def __init__(self, path, mode=FAST):
+        self.mode = mode
+        self._file = open(path, "rb")  # pylint: disable=consider-using-with
+        try:
+            (
+                self.compressed,
+                self.device_type,
+                self.device_id,
+                self.i2c_read_delay,
+                self.flags,
+            ) = read_header(self._file)
+        except ValueError:
+            self._file.close()
+            raise
+        self._map = None
+        self._view = None
+        self._position = 0
+        self._start = None
+        self._elapsed = 0
+        self._records = None
+        self._record_start = 0
+        self._record_count = 0
+        self._record_duration = 0
+        self._record_frame = None
+        if self.compressed:
+            self._rewind()
+            self.frame_count = sum(record[0] for record in self._records)
+            self._rewind()
+        else:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._map)
+            self.frame_count = (len(self._map) - HEADER_SIZE) // RECORD_SIZE
+        self._pointer = 0
+        self.seek(0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def close(self):
+        """Unmap and close the log."""
+        if self._map is not None:
+            self._view.release()
+            self._map.close()
+        self._file.close()
+
+    def device(self, **kwargs):
+        """Build an instance of the recorded device class on this bus.
+
+        :param kwargs: Passed on to the device class. Initialization and read
+            delays are skipped unless given, and logs recorded in the high
+            resolution data format are decoded in it.
+        """
+        kwargs.setdefault("i2c_read_delay", 0)
+        kwargs.setdefault("fast_init", True)
+        if self.flags & FLAG_HIGH_RESOLUTION:
+            kwargs.setdefault("high_resolution", True)
+        return device_class(self.device_type)(self, **kwargs)
+
+    @property
+    def position(self):
+        """The index of the next frame to be read."""
+        return self._position
+
+    def seek(self, position):
+        """Continue the replay from frame ``position``.
+
+        In `REALTIME` mode the pacing restarts from this frame.
+        """
+        if not 0 <= position <= self.frame_count:
+            raise IndexError("Frame position out of range")
+        self._position = position
+        self._start = None
+        self._elapsed = 0
+
+    def step(self, count=1):
+        """Move forward ``count`` frames."""
+        self.seek(self._position + count)
+
+    def frame(self, position):
+        """The raw frame recorded at ``position``, as a copy that stays valid
+        after the log is closed.
+
+        Compressed logs are streamed forward, so going back restarts from the
+        beginning.
+        """
+        return bytes(self._record(position)[1])
+
+    def _record(self, position):
+        if not self.compressed:
+            offset = HEADER_SIZE + position * RECORD_SIZE
+            delta = struct.unpack_from(_DELTA_FORMAT, self._map, offset)[0]
+            return delta, self._view[offset + _FRAME_OFFSET : offset + RECORD_SIZE]
+
+        if position < self._record_start:
+            self._rewind()
+        while position >= self._record_start + self._record_count:
+            self._record_start += self._record_count
+            count, duration, frame = next(self._records)
+            self._record_count = count
+            self._record_duration = duration
+            self._record_frame = bytes(frame)
+        return (
+            run_delta(
+                self._record_count,
+                self._record_duration,
+                position - self._record_start,
+            ),
+            self._record_frame,
+        )
+
+    def _rewind(self):
+        self._file.seek(0)
+        self._records = iter_records(self._file)
+        self._record_start = 0
+        self._record_count = 0
+        self._record_duration = 0
+        self._record_frame = None
+
+    def _next_frame(self):
+        position = self._position
+        if position >= self.frame_count:
+            raise EOFError("End of the frame log")
+        delta, frame = self._record(position)
+        if self.mode == REALTIME:
+            now = time.monotonic_ns()
+            if self._start is None:
+                self._start = now
+            else:
+                self._elapsed += delta
+                remaining = self._start + self._elapsed - now
+                if remaining > 0:
+                    time.sleep(remaining / 1e9)
+        if self.mode != STEP:
+            self._position += 1
+        return frame
+
+    # busio.I2C interface
+
+    def try_lock(self):  # pylint: disable=no-self-use
+        """Always succeeds, there is no bus to share."""
+        return True
+
+    def unlock(self):
+        """Nothing to release."""
+
+    def scan(self):  # pylint: disable=no-self-use
+        """The replayed accessory is always at 0x52."""
+        return [0x52]
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        """Sets the register pointer on single byte writes; other writes are ignored."""
+        # pylint: disable=unused-argument
+        if end is None:
+            end = len(buffer)
+        if end - start == 1:
+            self._pointer = buffer[start]
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        """Reads from the register pointer: frames at 0x00, the recorded id at
+        0xFA and the recorded data format at 0xFE."""
+        # pylint: disable=unused-argument
+        if end is None:
+            end = len(buffer)
+        if self._pointer == 0x00:
+            data = self._next_frame()
+        elif self._pointer == _ID_REGISTER:
+            data = self.device_id
+        elif self._pointer == _FORMAT_REGISTER:
+            data = b"\x03" if self.flags & FLAG_HIGH_RESOLUTION else b"\x01"
+        else:
+            data = b""
+        for index in range(start, end):
+            buffer[index] = data[index - start] if index - start < len(data) else 0xFF
+
+    def writeto_then_readfrom(
+        self,
+        address,
+        buffer_out,
+        buffer_in,
+        *,
+        out_start=0,
+        out_end=None,
+        in_start=0,
+        in_end=None
+    ):
+        """Write then read, see `writeto` and `readfrom_into`."""
+        self.writeto(address, buffer_out, start=out_start, end=out_end)
+        self.readfrom_into(address, buffer_in, start=in_start, end=in_end)
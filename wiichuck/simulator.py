@@ -0,0 +1,502 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`wiichuck.simulator`
+================================================================================
+
+Simulated I2C bus and accessories that speak the Wii extension controller
+protocol, for testing and benchmarking the device classes without hardware.
+
+.. code-block:: python
+
+    from wiichuck.nunchuk import Nunchuk
+    from wiichuck.simulator import SimulatedAccessory, SimulatedI2C, random_frames
+
+    accessory = SimulatedAccessory.for_device(Nunchuk, random_frames(Nunchuk))
+    nc = Nunchuk(SimulatedI2C(accessory), fast_init=True)
+    print(nc.values)
+
+
+* Author(s): John Furcean
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+* Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+"""
+import time
+import random
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
+
+IDS = {
+    "Nunchuk": b"\x00\x00\xA4\x20\x00\x00",
+    "ClassicController": b"\x00\x00\xA4\x20\x01\x01",
+    "Guitar": b"\x00\x00\xA4\x20\x01\x03",
+    "Drums": b"\x01\x00\xA4\x20\x01\x03",
+    "DJTable": b"\x03\x00\xA4\x20\x01\x03",
+    "UDraw": b"\xFF\x00\xA4\x20\x00\x12",
+}
+"""The extension controller identifier of each device class."""
+
+# the idle value and the range of every field, by device class; None for buttons
+_FIELDS = {
+    "Nunchuk": {
+        "joystick_x": (128, 0, 255),
+        "joystick_y": (128, 0, 255),
+        "C": None,
+        "Z": None,
+        "acceleration_x": (512, 0, 1023),
+        "acceleration_y": (512, 0, 1023),
+        "acceleration_z": (712, 0, 1023),
+    },
+    "ClassicController": {
+        "rx": (16, 0, 31),
+        "ry": (16, 0, 31),
+        "lx": (32, 0, 63),
+        "ly": (32, 0, 63),
+        "A": None,
+        "B": None,
+        "X": None,
+        "Y": None,
+        "R": None,
+        "L": None,
+        "ZR": None,
+        "ZL": None,
+        "start": None,
+        "select": None,
+        "home": None,
+        "dpad_up": None,
+        "dpad_down": None,
+        "dpad_right": None,
+        "dpad_left": None,
+        "trigger_right": (0, 0, 31),
+        "trigger_left": (0, 0, 31),
+    },
+    "Guitar": {
+        "joystick_x": (32, 0, 63),
+        "joystick_y": (32, 0, 63),
+        "orange": None,
+        "blue": None,
+        "yellow": None,
+        "red": None,
+        "green": None,
+        "start": None,
+        "select": None,
+        "strum_up": None,
+        "strum_down": None,
+        "whammy": (16, 0, 31),
+        "touchbar": (15, 0, 31),
+    },
+    "Drums": {
+        "joystick_x": (32, 0, 63),
+        "joystick_y": (32, 0, 63),
+        "orange": None,
+        "red": None,
+        "yellow": None,
+        "green": None,
+        "blue": None,
+        "bass": None,
+        "plus": None,
+        "minus": None,
+    },
+    "DJTable": {
+        "joystick_x": (32, 0, 63),
+        "joystick_y": (32, 0, 63),
+        "euphoria": None,
+        "start": None,
+        "select": None,
+        "right_turntable": (0, -31, 31),
+        "right_green": None,
+        "right_red": None,
+        "right_blue": None,
+        "left_turntable": (0, -31, 31),
+        "left_green": None,
+        "left_red": None,
+        "left_blue": None,
+        "dial": (0, 0, 31),
+        "slider": (8, 0, 15),
+    },
+    "UDraw": {
+        "x": (4095, 0, 4095),
+        "y": (4095, 0, 4095),
+        "tip": None,
+        "C": None,
+        "Z": None,
+        "pressure": (0, 0, 255),
+    },
+}
+
+
+def _class_name(device_class):
+    return device_class if isinstance(device_class, str) else device_class.__name__
+
+
+def _encode_values(name, fields):
+    # pylint: disable=too-many-return-statements
+    if name == "Nunchuk":
+        accel_x = fields["acceleration_x"]
+        accel_y = fields["acceleration_y"]
+        accel_z = fields["acceleration_z"]
+        return (
+            fields["joystick_x"],
+            fields["joystick_y"],
+            accel_x >> 2,
+            accel_y >> 2,
+            accel_z >> 2,
+            (accel_x & 0x3) << 6 | (accel_y & 0x3) << 4 | (accel_z & 0x3) << 2,
+        )
+    if name == "ClassicController":
+        right_x = fields["rx"]
+        left = fields["trigger_left"]
+        return (
+            (right_x & 0x18) << 3 | fields["lx"],
+            (right_x & 0x06) << 5 | fields["ly"],
+            (right_x & 0x01) << 7 | (left & 0x18) << 2 | fields["ry"],
+            (left & 0x07) << 5 | fields["trigger_right"],
+            0xFF,
+            0xFF,
+        )
+    if name == "Guitar":
+        return (
+            fields["joystick_x"],
+            fields["joystick_y"],
+            fields["touchbar"],
+            fields["whammy"],
+            0xFF,
+            0xFF,
+        )
+    if name == "Drums":
+        return (fields["joystick_x"], fields["joystick_y"], 0, 0, 0xFF, 0xFF)
+    if name == "DJTable":
+        right = abs(fields["right_turntable"])
+        left = abs(fields["left_turntable"])
+        dial = fields["dial"]
+        return (
+            (right & 0x18) << 3 | fields["joystick_x"],
+            (right & 0x06) << 5 | fields["joystick_y"],
+            (right & 0x01) << 7
+            | (dial & 0x18) << 2
+            | fields["slider"] << 1
+            | (fields["right_turntable"] < 0),
+            (dial & 0x07) << 5 | left,
+            0xFE | (fields["left_turntable"] < 0),
+            0xFF,
+        )
+    if name == "UDraw":
+        x = fields["x"]
+        y = fields["y"]
+        return (
+            x & 0xFF,
+            y & 0xFF,
+            (y & 0xF00) >> 4 | (x & 0xF00) >> 8,
+            fields["pressure"],
+            0xFF,
+            0xF8,
+        )
+    raise ValueError("No encoder for {}".format(name))
+
+
+def _high_resolution_frame(frame):
+    """The Classic Controller ``frame`` in data format 3, every value in its
+    own byte and the buttons in bytes 6 and 7."""
+    right_x = (frame[0] & 0xC0) >> 3 | (frame[1] & 0xC0) >> 5 | frame[2] >> 7
+    left = (frame[2] & 0x60) >> 2 | frame[3] >> 5
+    return bytes(
+        (
+            (frame[0] & 0x3F) << 2,
+            right_x << 3,
+            (frame[1] & 0x3F) << 2,
+            (frame[2] & 0x1F) << 3,
+            left << 3,
+            (frame[3] & 0x1F) << 3,
+            frame[4],
+            frame[5],
+        )
+    )
+
+
+def _button_bit(device_class, field):
+    if field.startswith("dpad_"):
+        field = field[5:]
+    return getattr(device_class, "BTN_" + field.upper())
+
+
+def encode(device_class, **fields):
+    """Build the 8 byte frame that ``device_class`` decodes to ``fields``.
+
+    :param device_class: The device class, such as
+        `wiichuck.nunchuk.Nunchuk`.
+    :param fields: Values named like the fields of the device's ``state``,
+        for example ``joystick_x=200, C=True``. Fields that are not given
+        keep their idle value: sticks centered and buttons released.
+    """
+    name = _class_name(device_class)
+    spec = _FIELDS[name]
+    values = {}
+    pressed = 0
+    for field, limits in spec.items():
+        if limits is None:
+            if fields.get(field, False):
+                pressed |= _button_bit(device_class, field)
+        else:
+            values[field] = fields.get(field, limits[0])
+    frame = bytearray(_encode_values(name, values) + (0, 0))
+    # pylint: disable=protected-access
+    mask = device_class._BUTTONS_MASK
+    buttons = (frame[4] << 8 | frame[5]) & ~mask
+    buttons |= (pressed ^ device_class._BUTTONS_INVERT) & mask
+    frame[4] = buttons >> 8
+    frame[5] = buttons & 0xFF
+    return frame
+
+
+def idle_frames(device_class):
+    """Yield the idle frame of ``device_class`` forever."""
+    frame = encode(device_class)
+    while True:
+        yield frame
+
+
+def scripted_frames(frames, loop=True):
+    """Yield the given frames in order, over and over when ``loop`` is True."""
+    frames = [bytes(frame) for frame in frames]
+    while True:
+        for frame in frames:
+            yield frame
+        if not loop:
+            return
+
+
+def random_frames(device_class, seed=None, change_rate=1.0):
+    """Yield frames of ``device_class`` with random field values.
+
+    :param int seed: Seed for reproducible sequences.
+    :param float change_rate: The probability that a frame differs from the
+        previous one, lower values simulate a mostly idle controller.
+    """
+    rng = random.Random(seed) if hasattr(random, "Random") else random
+    if seed is not None and rng is random:
+        random.seed(seed)
+    spec = _FIELDS[_class_name(device_class)]
+    frame = encode(device_class)
+    while True:
+        if rng.random() < change_rate:
+            fields = {}
+            for field, limits in spec.items():
+                if limits is None:
+                    fields[field] = rng.random() < 0.5
+                else:
+                    fields[field] = rng.randint(limits[1], limits[2])
+            frame = encode(device_class, **fields)
+        yield frame
+
+
+class SimulatedAccessory:  # pylint: disable=too-many-instance-attributes
+    """
+    A simulated extension controller.
+
+    It answers with 0xFF until the ``0xF0 0x55`` / ``0xFB 0x00`` init writes
+    are received, then serves frames from ``frames`` at register 0x00, the
+    identifier at 0xFA, calibration data at 0x20 and the data format at
+    0xFE.
+
+    :param frames: An iterator of 6 or 8 byte frames, see `idle_frames`,
+        `scripted_frames` and `random_frames`. The last frame is repeated
+        once it runs out.
+    :param bytes device_id: The 6 byte identifier.
+    :param int address: The I2C address. Default is 0x52.
+    :param float latency: The time in seconds after the register pointer
+        is written before the data can be read; earlier reads return 0xFF.
+    :param float error_rate: The probability that a transaction raises
+        `OSError`.
+    :param float invalid_rate: The probability that a frame read returns
+        all 0xFF.
+    :param int seed: Seed for the fault injection.
+    :param data_formats: The values accepted by the data format register
+        0xFE; other writes to it are ignored like on accessories that do
+        not support them. Default is only the standard format 1. In format 3
+        the Classic Controller frames of ``frames`` are served in the high
+        resolution layout, scaled up to 8 bits.
+    """
+
+    def __init__(
+        self,
+        frames,
+        device_id=IDS["Nunchuk"],
+        address=0x52,
+        latency=0.0002,
+        error_rate=0.0,
+        invalid_rate=0.0,
+        seed=None,
+        data_formats=(1,),
+    ):  # pylint: disable=too-many-arguments
+        self.frames = frames
+        self.device_id = bytes(device_id)
+        self.address = address
+        self.latency = latency
+        self.error_rate = error_rate
+        self.invalid_rate = invalid_rate
+        self.data_formats = data_formats
+        self.registers = {0x20: bytes(16), 0xFE: b"\x01"}
+        self.initialized = False
+        self._connected = True
+        self._frame = bytes(8)
+        self._pointer = 0
+        self._pointer_time = 0
+        self._rng = random.Random(seed) if hasattr(random, "Random") else random
+        self.reads = 0
+        self.writes = 0
+
+    @classmethod
+    def for_device(cls, device_class, frames=None, **kwargs):
+        """A simulated accessory identifying as ``device_class``.
+
+        :param frames: See `SimulatedAccessory`, the idle frame by default.
+        :param kwargs: Passed on to `SimulatedAccessory`.
+        """
+        if frames is None:
+            frames = idle_frames(device_class)
+        kwargs.setdefault("device_id", IDS[_class_name(device_class)])
+        if _class_name(device_class) == "ClassicController":
+            kwargs.setdefault("data_formats", (1, 3))
+        return cls(frames, **kwargs)
+
+    @property
+    def connected(self):
+        """Whether the accessory is plugged in. Unplugging it makes every
+        transaction raise `OSError` and plugging it back in requires a new
+        init."""
+        return self._connected
+
+    @connected.setter
+    def connected(self, value):
+        self._connected = value
+        if not value:
+            self.initialized = False
+
+    def _fault(self):
+        if not self._connected or (
+            self.error_rate and self._rng.random() < self.error_rate
+        ):
+            raise OSError(121, "Simulated accessory did not respond")
+
+    def write(self, data):
+        """Handle a write: a register pointer or a register value."""
+        self._fault()
+        self.writes += 1
+        if len(data) == 1:
+            self._pointer = data[0]
+            self._pointer_time = time.monotonic_ns()
+        elif len(data) >= 2:
+            if data[0] == 0xF0 and data[1] == 0x55:
+                self.initialized = True
+                self.registers[0xFE] = b"\x01"
+            elif data[0] == 0xFE:
+                if data[1] in self.data_formats:
+                    self.registers[0xFE] = bytes(data[1:2])
+            elif data[0] != 0xFB:
+                self.registers[data[0]] = bytes(data[1:])
+
+    def read(self, buffer, start, end):
+        """Handle a read from the register pointer."""
+        self._fault()
+        self.reads += 1
+        data = b""
+        early = time.monotonic_ns() - self._pointer_time < self.latency * 1e9
+        if self.initialized and not early:
+            if self._pointer == 0x00:
+                self._frame = next(self.frames, self._frame)
+                if not self.invalid_rate or self._rng.random() >= self.invalid_rate:
+                    data = self._frame
+                    if self.registers[0xFE] == b"\x03":
+                        data = _high_resolution_frame(data)
+            elif self._pointer == 0xFA:
+                data = self.device_id
+            else:
+                data = self.registers.get(self._pointer, b"")
+        for index in range(start, end):
+            offset = index - start
+            buffer[index] = data[offset] if offset < len(data) else 0xFF
+
+
+class SimulatedI2C:
+    """
+    A `busio.I2C` stand-in carrying simulated accessories, which can be
+    passed to the device class constructors unchanged.
+
+    :param accessories: The `SimulatedAccessory` objects on the bus, each
+        at its own address.
+    """
+
+    def __init__(self, *accessories):
+        self.accessories = {accessory.address: accessory for accessory in accessories}
+        self._locked = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.deinit()
+
+    def deinit(self):
+        """Nothing to release."""
+
+    def try_lock(self):
+        """Lock the bus, returning False if it is already locked."""
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self):
+        """Release the bus lock."""
+        self._locked = False
+
+    def scan(self):
+        """The addresses of the connected accessories."""
+        return [
+            address
+            for address, accessory in sorted(self.accessories.items())
+            if accessory.connected
+        ]
+
+    def _accessory(self, address):
+        accessory = self.accessories.get(address)
+        if accessory is None:
+            raise OSError(19, "No simulated accessory at 0x{:02x}".format(address))
+        return accessory
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        """Write ``buffer[start:end]`` to the accessory at ``address``."""
+        if end is None:
+            end = len(buffer)
+        self._accessory(address).write(bytes(buffer[start:end]))
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        """Read from the accessory at ``address`` into ``buffer[start:end]``."""
+        if end is None:
+            end = len(buffer)
+        self._accessory(address).read(buffer, start, end)
+
+    def writeto_then_readfrom(
+        self,
+        address,
+        buffer_out,
+        buffer_in,
+        *,
+        out_start=0,
+        out_end=None,
+        in_start=0,
+        in_end=None
+    ):
+        """Write then read, see `writeto` and `readfrom_into`."""
+        self.writeto(address, buffer_out, start=out_start, end=out_end)
+        self.readfrom_into(address, buffer_in, start=in_start, end=in_end)
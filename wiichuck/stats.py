@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2023 John Furcean
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`wiichuck.stats`
+================================================================================
+
+Read latency and error counters for Nintento WiiMote I2C Accessory Devices.
+
+
+* Author(s): John Furcean
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+"""
+import time
+from array import array
+from collections import namedtuple
+
+__version__ = "0.0.0-auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
+
+HISTOGRAM_BUCKETS = 16
+"""Bucket n counts the transactions that took from 2**n to 2**(n+1)
+microseconds, the first and last buckets also count anything shorter or
+longer."""
+
+
+class ReadStats:
+    """
+    Counters updated by a device as it reads, see ``WiiChuckBase.stats``.
+    """
+
+    _Stats = namedtuple(
+        "Stats",
+        (
+            "reads",
+            "frames",
+            "rate",
+            "errors",
+            "invalid_frames",
+            "reinits",
+            "histogram",
+        ),
+    )
+
+    def __init__(self):
+        self.histogram = array("L", [0] * HISTOGRAM_BUCKETS)
+        self.first_frame = None
+        self.last_frame = None
+        self.reset()
+
+    def reset(self):
+        """Zero every counter."""
+        self.reads = 0
+        self.frames = 0
+        self.errors = 0
+        self.invalid_frames = 0
+        self.reinits = 0
+        self.first_frame = None
+        self.last_frame = None
+        for bucket in range(HISTOGRAM_BUCKETS):
+            self.histogram[bucket] = 0
+
+    def add_read(self, duration):
+        """Count a register read that took ``duration`` nanoseconds."""
+        self.reads += 1
+        bucket = 0
+        duration //= 1000
+        while duration > 1 and bucket < HISTOGRAM_BUCKETS - 1:
+            duration >>= 1
+            bucket += 1
+        self.histogram[bucket] += 1
+
+    def add_frame(self, invalid):
+        """Count a data frame, ``invalid`` when it was all 0xFF."""
+        now = time.monotonic_ns()
+        if self.first_frame is None:
+            self.first_frame = now
+        self.last_frame = now
+        self.frames += 1
+        if invalid:
+            self.invalid_frames += 1
+
+    def snapshot(self):
+        """The current counters.
+
+        :return: A ``(reads, frames, rate, errors, invalid_frames, reinits,
+            histogram)`` namedtuple. ``reads`` counts every register read and
+            ``frames`` the data frames among them, ``rate`` is the number of
+            frames per second between the first and last one, ``errors``
+            counts the reads that raised an `OSError` and ``histogram`` is a
+            tuple with the transaction time buckets.
+        """
+        rate = 0
+        # the clock may not have ticked between frames on CircuitPython
+        if self.frames > 1 and self.last_frame > self.first_frame:
+            rate = (self.frames - 1) * 1e9 / (self.last_frame - self.first_frame)
+        return self._Stats(
+            self.reads,
+            self.frames,
+            rate,
+            self.errors,
+            self.invalid_frames,
+            self.reinits,
+            tuple(self.histogram),
+        )
@@ -27,12 +27,26 @@ Implementation Notes
 * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
 """
 from collections import namedtuple
-from wiichuck import WiiChuckBase
+from wiichuck import WiiChuckBase, WiiChuckState
+from wiichuck.layout import Button, Field, Group, Layout
 
 __version__ = "0.0.0-auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Nunchuk.git"
 
 
+class UDrawState(WiiChuckState):  # pylint: disable=too-few-public-methods
+    """Mutable state of a `UDraw`, updated in place by `UDraw.update`."""
+
+    __slots__ = (
+        "x",
+        "y",
+        "tip",
+        "C",
+        "Z",
+        "pressure",
+    )
+
+
 class UDraw(WiiChuckBase):
     """
     Class which provides interface to Nintendo Nunchuk controller.
@@ -45,59 +59,88 @@ class UDraw(WiiChuckBase):
         conservative default of 2000us is used since some hosts may
         not be able to achieve such timing.
     :type i2c_read_delay: float, optional
+    :param pipelined: When True, the register pointer for the next frame is
+        written right after each read so that reads no longer block for the
+        full ``i2c_read_delay``. Default is False.
+    :type pipelined: bool, optional
+    :param fast_init: When True, the accessory is initialized as soon as it
+        responds instead of after two fixed 100ms pauses. Default is False.
+    :type fast_init: bool, optional
+    :param history: The number of frames to keep in ``history``. Default is
+        0, no history.
+    :type history: int, optional
+    :param stats: When True, reads are timed and counted in ``stats``.
+        Default is False.
+    :type stats: bool, optional
+    :param reconnect: When True, a disconnected accessory does not make
+        reads raise `OSError` and is re-initialized with an exponential
+        backoff, see ``connected``. Default is False.
+    :type reconnect: bool, optional
     """
 
+    BTN_TIP = 0x0004
+    BTN_C = 0x0002
+    BTN_Z = 0x0001
+
     _Values = namedtuple("Values", ("position", "buttons", "pressure"))
     _Position = namedtuple("Position", ("x", "y"))
     _Buttons = namedtuple("Buttons", ("tip", "C", "Z"))
     _Pressure = namedtuple("Pressure", ("pressure"))
 
-    def __init__(self, i2c, address=0x52, i2c_read_delay=0.002):
-        super().__init__(i2c, address=address, i2c_read_delay=i2c_read_delay)
-
-    @property
-    def values(self):
-        """The current state of all values."""
-        self._read_data()
-        return self._Values(
-            self._position(do_read=False),
-            self._buttons(do_read=False),
-            self._pressure(do_read=False),
+    _LAYOUT = Layout(
+        Group(
+            _Values,
+            Group(
+                _Position,
+                Field((2, 0x0F, -8), (0, 0xFF, 0)),  # x
+                Field((2, 0xF0, -4), (1, 0xFF, 0)),  # y
+            ),
+            Group(
+                _Buttons,
+                Button(5, 0x04, active_low=False),  # tip
+                Button(5, 0x02),  # C
+                Button(5, 0x01),  # Z
+            ),
+            Field((3, 0xFF, 0)),  # pressure
         )
+    )
+    _BUTTONS_MASK = _LAYOUT.buttons_mask
+    _BUTTONS_INVERT = _LAYOUT.buttons_invert
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        i2c,
+        address=0x52,
+        i2c_read_delay=0.002,
+        pipelined=False,
+        fast_init=False,
+        history=0,
+        stats=False,
+        reconnect=False,
+    ):
+        super().__init__(
+            i2c,
+            address=address,
+            i2c_read_delay=i2c_read_delay,
+            pipelined=pipelined,
+            fast_init=fast_init,
+            history=history,
+            stats=stats,
+            reconnect=reconnect,
+        )
+        self.state = UDrawState(self._LAYOUT)
 
     @property
     def position(self):
         """The current pen tip position."""
-        return self._position()
+        return self._value("position")
 
     @property
     def buttons(self):
         """The current pressed state of all buttons."""
-        return self._buttons()
+        return self._value("buttons")
 
     @property
     def pressure(self):
         """The current pressure reading."""
-        return self._pressure()
-
-    def _position(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Position(
-            ((self.buffer[2] & 0x0F) << 8 | self.buffer[0]),  # x
-            ((self.buffer[2] & 0xF0) << 4 | self.buffer[1]),  # y
-        )
-
-    def _buttons(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self._Buttons(
-            bool((self.buffer[5] & 0x04) >> 2),  # tip
-            not bool((self.buffer[5] & 0x02) >> 1),  # C
-            not bool(self.buffer[5] & 0x01),  # Z
-        )
-
-    def _pressure(self, do_read=True):
-        if do_read:
-            self._read_data()
-        return self.buffer[3]
+        return self._value("pressure")